@@ -0,0 +1,155 @@
+"""partition attendance by month
+
+Revision ID: 0e3540c43c07
+Revises: 6a785b827633
+Create Date: 2026-10-17 15:07:44.915362
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0e3540c43c07'
+down_revision: Union[str, None] = '6a785b827633'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Statement-level triggers from earlier revisions (f40d912d1004, dd6ede3b6eea,
+# 6a785b827633); recreated on whichever table ends up named "attendance".
+ATTENDANCE_TRIGGERS = [
+    ("attendance_daily_insert", "INSERT", "REFERENCING NEW TABLE AS new_rows", "attendance_daily_rollup"),
+    ("attendance_daily_update", "UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows", "attendance_daily_rollup"),
+    ("attendance_daily_delete", "DELETE", "REFERENCING OLD TABLE AS old_rows", "attendance_daily_rollup"),
+    ("attendance_monthly_insert", "INSERT", "REFERENCING NEW TABLE AS new_rows", "attendance_monthly_rollup"),
+    ("attendance_monthly_update", "UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows", "attendance_monthly_rollup"),
+    ("attendance_monthly_delete", "DELETE", "REFERENCING OLD TABLE AS old_rows", "attendance_monthly_rollup"),
+    ("attendance_version_insert", "INSERT", "REFERENCING NEW TABLE AS new_rows", "attendance_bump_version"),
+    ("attendance_version_update", "UPDATE", "REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows", "attendance_bump_version"),
+    ("attendance_version_delete", "DELETE", "REFERENCING OLD TABLE AS old_rows", "attendance_bump_version"),
+]
+
+
+def create_attendance_triggers() -> None:
+    for name, event, referencing, function in ATTENDANCE_TRIGGERS:
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON attendance {referencing} "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION {function}()"
+        )
+
+
+def rename_old_attendance() -> None:
+    """Move the current table aside, freeing its constraint/index names."""
+    op.execute("ALTER TABLE attendance RENAME TO attendance_old")
+    op.execute("ALTER TABLE attendance_old RENAME CONSTRAINT attendance_pkey TO attendance_old_pkey")
+    op.execute("ALTER TABLE attendance_old RENAME CONSTRAINT unique_employee_date TO attendance_old_unique_employee_date")
+    op.execute("ALTER TABLE attendance_old RENAME CONSTRAINT attendance_employee_id_fkey TO attendance_old_employee_id_fkey")
+    op.execute("ALTER SEQUENCE attendance_id_seq OWNED BY NONE")
+
+
+def drop_old_attendance() -> None:
+    # Rows were copied, not re-marked: the copy must not run through the
+    # rollup/version triggers, which is why they are created afterwards.
+    op.execute("DROP TABLE attendance_old")
+    op.execute("ALTER SEQUENCE attendance_id_seq OWNED BY attendance.id")
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    rename_old_attendance()
+
+    # Unique constraints on a partitioned table must include the partition
+    # key, so the primary key becomes (id, date); unique_employee_date already
+    # qualifies and keeps its name for ON CONFLICT.
+    op.execute("""
+        CREATE TABLE attendance (
+            id integer NOT NULL DEFAULT nextval('attendance_id_seq'),
+            employee_id integer,
+            date date NOT NULL,
+            status varchar(20) NOT NULL,
+            CONSTRAINT attendance_pkey PRIMARY KEY (id, date),
+            CONSTRAINT unique_employee_date UNIQUE (employee_id, date),
+            CONSTRAINT attendance_employee_id_fkey FOREIGN KEY (employee_id)
+                REFERENCES employees (id) ON DELETE CASCADE
+        ) PARTITION BY RANGE (date)
+    """)
+    # Safety net for dates without a monthly partition yet; drained by
+    # ensure_attendance_partitions() when the matching month is created.
+    op.execute("CREATE TABLE attendance_default PARTITION OF attendance DEFAULT")
+
+    op.execute("""
+        CREATE FUNCTION ensure_attendance_partitions(months_ahead integer, from_month date DEFAULT NULL)
+        RETURNS integer
+        LANGUAGE plpgsql AS $$
+        DECLARE
+            month_start date := date_trunc('month', COALESCE(from_month, current_date))::date;
+            last_month date := (date_trunc('month', current_date) + make_interval(months => months_ahead))::date;
+            month_end date;
+            partition_name text;
+            created integer := 0;
+        BEGIN
+            WHILE month_start <= last_month LOOP
+                month_end := (month_start + interval '1 month')::date;
+                partition_name := 'attendance_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM');
+                IF to_regclass(partition_name) IS NULL THEN
+                    EXECUTE format(
+                        'CREATE TABLE %I (LIKE attendance INCLUDING DEFAULTS, '
+                        'CHECK (date >= %L AND date < %L))',
+                        partition_name, month_start, month_end);
+                    -- Rows that landed in the default partition move to their month.
+                    -- Writes go straight to the partitions, so no rollup triggers fire.
+                    EXECUTE format(
+                        'WITH moved AS (DELETE FROM attendance_default WHERE date >= %L AND date < %L RETURNING *) '
+                        'INSERT INTO %I SELECT * FROM moved',
+                        month_start, month_end, partition_name);
+                    EXECUTE format(
+                        'ALTER TABLE attendance ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                        partition_name, month_start, month_end);
+                    created := created + 1;
+                END IF;
+                month_start := month_end;
+            END LOOP;
+            RETURN created;
+        END;
+        $$
+    """)
+    op.execute("""
+        SELECT ensure_attendance_partitions(
+            3,
+            (SELECT LEAST(MIN(date), current_date) FROM attendance_old)
+        )
+    """)
+
+    op.execute("""
+        INSERT INTO attendance (id, employee_id, date, status)
+        SELECT id, employee_id, date, status FROM attendance_old
+    """)
+    drop_old_attendance()
+    create_attendance_triggers()
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    rename_old_attendance()
+
+    op.create_table('attendance',
+    sa.Column('id', sa.Integer(), server_default=sa.text("nextval('attendance_id_seq')"), nullable=False),
+    sa.Column('employee_id', sa.Integer(), nullable=True),
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('status', sa.String(length=20), nullable=False),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], name='attendance_employee_id_fkey', ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('id', name='attendance_pkey'),
+    sa.UniqueConstraint('employee_id', 'date', name='unique_employee_date')
+    )
+    op.execute("""
+        INSERT INTO attendance (id, employee_id, date, status)
+        SELECT id, employee_id, date, status FROM attendance_old
+    """)
+    # Drops the attached partitions; detached archive tables are left alone
+    op.execute("DROP TABLE attendance_old CASCADE")
+    op.execute("ALTER SEQUENCE attendance_id_seq OWNED BY attendance.id")
+    op.execute("DROP FUNCTION ensure_attendance_partitions(integer, date)")
+    create_attendance_triggers()
@@ -0,0 +1,64 @@
+"""add employee code sequence
+
+Revision ID: 186f1b2b3e61
+Revises: f9ba631f2168
+Create Date: 2026-10-17 10:03:27.518204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '186f1b2b3e61'
+down_revision: Union[str, None] = 'f9ba631f2168'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE SEQUENCE employee_code_seq")
+
+    # Continue numbering after the highest existing EMPnnn code
+    op.execute("""
+        SELECT setval(
+            'employee_code_seq',
+            COALESCE(MAX(substring(employee_code FROM '^EMP([0-9]+)$')::bigint), 0) + 1,
+            false
+        )
+        FROM employees
+    """)
+
+    op.execute("""
+        CREATE FUNCTION format_employee_code(n bigint) RETURNS varchar
+        LANGUAGE sql IMMUTABLE AS
+        $$ SELECT 'EMP' || lpad(n::text, greatest(3, length(n::text)), '0') $$
+    """)
+    op.execute("""
+        CREATE FUNCTION next_employee_code() RETURNS varchar
+        LANGUAGE sql VOLATILE AS
+        $$ SELECT format_employee_code(nextval('employee_code_seq')) $$
+    """)
+
+    op.alter_column(
+        'employees', 'employee_code',
+        server_default=sa.text('next_employee_code()'),
+        existing_type=sa.String(length=50),
+        existing_nullable=False,
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.alter_column(
+        'employees', 'employee_code',
+        server_default=None,
+        existing_type=sa.String(length=50),
+        existing_nullable=False,
+    )
+    op.execute("DROP FUNCTION next_employee_code()")
+    op.execute("DROP FUNCTION format_employee_code(bigint)")
+    op.execute("DROP SEQUENCE employee_code_seq")
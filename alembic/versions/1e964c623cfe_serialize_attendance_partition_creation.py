@@ -0,0 +1,73 @@
+"""serialize attendance partition creation
+
+Revision ID: 1e964c623cfe
+Revises: 4af81efe883e
+Create Date: 2026-10-18 14:05:12.301844
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e964c623cfe'
+down_revision: Union[str, None] = '4af81efe883e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Body of ensure_attendance_partitions() as created in 0e3540c43c07;
+# {lock} is spliced in right after BEGIN.
+ENSURE_FUNCTION = """
+    CREATE OR REPLACE FUNCTION ensure_attendance_partitions(months_ahead integer, from_month date DEFAULT NULL)
+    RETURNS integer
+    LANGUAGE plpgsql AS $$
+    DECLARE
+        month_start date := date_trunc('month', COALESCE(from_month, current_date))::date;
+        last_month date := (date_trunc('month', current_date) + make_interval(months => months_ahead))::date;
+        month_end date;
+        partition_name text;
+        created integer := 0;
+    BEGIN{lock}
+        WHILE month_start <= last_month LOOP
+            month_end := (month_start + interval '1 month')::date;
+            partition_name := 'attendance_y' || to_char(month_start, 'YYYY') || 'm' || to_char(month_start, 'MM');
+            IF to_regclass(partition_name) IS NULL THEN
+                EXECUTE format(
+                    'CREATE TABLE %I (LIKE attendance INCLUDING DEFAULTS, '
+                    'CHECK (date >= %L AND date < %L))',
+                    partition_name, month_start, month_end);
+                -- Rows that landed in the default partition move to their month.
+                -- Writes go straight to the partitions, so no rollup triggers fire.
+                EXECUTE format(
+                    'WITH moved AS (DELETE FROM attendance_default WHERE date >= %L AND date < %L RETURNING *) '
+                    'INSERT INTO %I SELECT * FROM moved',
+                    month_start, month_end, partition_name);
+                EXECUTE format(
+                    'ALTER TABLE attendance ATTACH PARTITION %I FOR VALUES FROM (%L) TO (%L)',
+                    partition_name, month_start, month_end);
+                created := created + 1;
+            END IF;
+            month_start := month_end;
+        END LOOP;
+        RETURN created;
+    END;
+    $$
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Replicas starting (or running the daily ensure) together could both
+    # see to_regclass() IS NULL and race to CREATE the same partition; the
+    # loser failed. A transaction-scoped advisory lock makes callers take
+    # turns, and the second one then finds the partitions already there.
+    op.execute(ENSURE_FUNCTION.replace("{lock}", """
+        PERFORM pg_advisory_xact_lock(hashtext('ensure_attendance_partitions'));"""))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute(ENSURE_FUNCTION.replace("{lock}", ""))
@@ -0,0 +1,68 @@
+"""shard employees version counter
+
+Revision ID: 4af81efe883e
+Revises: 8defaf56fdc6
+Create Date: 2026-10-18 10:12:40.517203
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4af81efe883e'
+down_revision: Union[str, None] = '8defaf56fdc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Must match EMPLOYEES_VERSION_SHARDS in app/crud/data_version.py
+EMPLOYEES_VERSION_SHARDS = 16
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The original trigger updated the single 'employees' row, so every
+    # concurrent employee write (CSV import, generator batches, API) queued
+    # on that row lock until the writer committed. Spread the bump over
+    # 'employees#<n>' rows picked by backend pid; readers sum them.
+    #
+    # A sequence (nextval) would avoid row locks entirely, but sequence
+    # values are not transactional: a reader could see a version whose data
+    # is not committed yet, hand out that ETag for the old rows, and keep
+    # answering 304 after the commit. Summed counters only ever grow by one
+    # per committed write, so an ETag never runs ahead of the data.
+    op.execute(f"""
+        CREATE OR REPLACE FUNCTION employees_bump_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO data_versions (scope, version)
+            VALUES ('employees#' || (pg_backend_pid() % {EMPLOYEES_VERSION_SHARDS}), 1)
+            ON CONFLICT (scope) DO UPDATE SET version = data_versions.version + 1;
+            RETURN NULL;
+        END;
+        $$
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("""
+        INSERT INTO data_versions (scope, version)
+        SELECT 'employees', COALESCE(sum(version), 0) + 1 FROM data_versions
+        WHERE scope = 'employees' OR scope LIKE 'employees#%'
+        ON CONFLICT (scope) DO UPDATE SET version = EXCLUDED.version
+    """)
+    op.execute("DELETE FROM data_versions WHERE scope LIKE 'employees#%'")
+    op.execute("""
+        CREATE OR REPLACE FUNCTION employees_bump_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO data_versions (scope, version) VALUES ('employees', 1)
+            ON CONFLICT (scope) DO UPDATE SET version = data_versions.version + 1;
+            RETURN NULL;
+        END;
+        $$
+    """)
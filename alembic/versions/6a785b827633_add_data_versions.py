@@ -0,0 +1,95 @@
+"""add data versions
+
+Revision ID: 6a785b827633
+Revises: dd6ede3b6eea
+Create Date: 2026-10-17 13:52:16.087731
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6a785b827633'
+down_revision: Union[str, None] = 'dd6ede3b6eea'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('data_versions',
+    sa.Column('scope', sa.String(length=64), nullable=False),
+    sa.Column('version', sa.BigInteger(), nullable=False, server_default='1'),
+    sa.PrimaryKeyConstraint('scope')
+    )
+
+    # Any write to employees bumps the "employees" scope
+    op.execute("""
+        CREATE FUNCTION employees_bump_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            INSERT INTO data_versions (scope, version) VALUES ('employees', 1)
+            ON CONFLICT (scope) DO UPDATE SET version = data_versions.version + 1;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER employees_bump_version
+        AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON employees
+        FOR EACH STATEMENT EXECUTE FUNCTION employees_bump_version()
+    """)
+
+    # Attendance writes bump "attendance:<employee_id>" for each touched employee
+    touched = {
+        "INSERT": "SELECT employee_id FROM new_rows",
+        "DELETE": "SELECT employee_id FROM old_rows",
+        "UPDATE": "SELECT employee_id FROM new_rows UNION SELECT employee_id FROM old_rows",
+    }
+    bump = """
+                INSERT INTO data_versions (scope, version)
+                SELECT DISTINCT 'attendance:' || employee_id, 1
+                FROM ({rows}) touched
+                WHERE employee_id IS NOT NULL
+                ON CONFLICT (scope) DO UPDATE SET version = data_versions.version + 1;"""
+    op.execute(f"""
+        CREATE FUNCTION attendance_bump_version() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN{bump.format(rows=touched["INSERT"])}
+            ELSIF TG_OP = 'DELETE' THEN{bump.format(rows=touched["DELETE"])}
+            ELSE{bump.format(rows=touched["UPDATE"])}
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_version_insert AFTER INSERT ON attendance
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_bump_version()
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_version_update AFTER UPDATE ON attendance
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_bump_version()
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_version_delete AFTER DELETE ON attendance
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_bump_version()
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER attendance_version_delete ON attendance")
+    op.execute("DROP TRIGGER attendance_version_update ON attendance")
+    op.execute("DROP TRIGGER attendance_version_insert ON attendance")
+    op.execute("DROP TRIGGER employees_bump_version ON employees")
+    op.execute("DROP FUNCTION attendance_bump_version()")
+    op.execute("DROP FUNCTION employees_bump_version()")
+    op.drop_table('data_versions')
@@ -0,0 +1,36 @@
+"""add user login indexes
+
+Revision ID: 7e805e95b982
+Revises: 0e3540c43c07
+Create Date: 2026-10-17 16:21:30.448190
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7e805e95b982'
+down_revision: Union[str, None] = '0e3540c43c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index(
+        'ix_users_username_active', 'users', ['username'], unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+    op.create_index(
+        'ix_users_phone_number_active', 'users', ['phone_number'], unique=False,
+        postgresql_where=sa.text('is_deleted = false'),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_users_phone_number_active', table_name='users')
+    op.drop_index('ix_users_username_active', table_name='users')
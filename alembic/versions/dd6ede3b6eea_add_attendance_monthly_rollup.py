@@ -0,0 +1,101 @@
+"""add attendance monthly rollup
+
+Revision ID: dd6ede3b6eea
+Revises: f40d912d1004
+Create Date: 2026-10-17 11:28:09.664312
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'dd6ede3b6eea'
+down_revision: Union[str, None] = 'f40d912d1004'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('attendance_monthly',
+    sa.Column('employee_id', sa.Integer(), nullable=False),
+    sa.Column('month', sa.Date(), nullable=False),
+    sa.Column('present_days', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('absent_days', sa.Integer(), nullable=False, server_default='0'),
+    sa.ForeignKeyConstraint(['employee_id'], ['employees.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('employee_id', 'month')
+    )
+    op.create_index('ix_attendance_monthly_month', 'attendance_monthly', ['month', 'employee_id'], unique=False)
+
+    # Same shape as attendance_daily_rollup(); the join on employees skips rows
+    # removed by ON DELETE CASCADE, whose rollup rows cascade away anyway.
+    attendance_changes = {
+        "INSERT": "SELECT employee_id, date, status, 1 AS delta FROM new_rows",
+        "DELETE": "SELECT employee_id, date, status, -1 AS delta FROM old_rows",
+        "UPDATE": (
+            "SELECT employee_id, date, status, 1 AS delta FROM new_rows "
+            "UNION ALL SELECT employee_id, date, status, -1 FROM old_rows"
+        ),
+    }
+    monthly_upsert = """
+                INSERT INTO attendance_monthly (employee_id, month, present_days, absent_days)
+                SELECT c.employee_id, date_trunc('month', c.date)::date,
+                       COALESCE(sum(c.delta) FILTER (WHERE c.status = 'PRESENT'), 0),
+                       COALESCE(sum(c.delta) FILTER (WHERE c.status = 'ABSENT'), 0)
+                FROM ({changes}) c
+                JOIN employees e ON e.id = c.employee_id
+                GROUP BY c.employee_id, date_trunc('month', c.date)
+                ON CONFLICT (employee_id, month) DO UPDATE
+                SET present_days = attendance_monthly.present_days + EXCLUDED.present_days,
+                    absent_days = attendance_monthly.absent_days + EXCLUDED.absent_days;"""
+    op.execute(f"""
+        CREATE FUNCTION attendance_monthly_rollup() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN{monthly_upsert.format(changes=attendance_changes["INSERT"])}
+            ELSIF TG_OP = 'DELETE' THEN{monthly_upsert.format(changes=attendance_changes["DELETE"])}
+            ELSE{monthly_upsert.format(changes=attendance_changes["UPDATE"])}
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_monthly_insert AFTER INSERT ON attendance
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_monthly_rollup()
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_monthly_update AFTER UPDATE ON attendance
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_monthly_rollup()
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_monthly_delete AFTER DELETE ON attendance
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_monthly_rollup()
+    """)
+
+    # Backfill from existing data
+    op.execute("""
+        INSERT INTO attendance_monthly (employee_id, month, present_days, absent_days)
+        SELECT employee_id, date_trunc('month', date)::date,
+               count(*) FILTER (WHERE status = 'PRESENT'),
+               count(*) FILTER (WHERE status = 'ABSENT')
+        FROM attendance
+        WHERE employee_id IS NOT NULL
+        GROUP BY employee_id, date_trunc('month', date)
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER attendance_monthly_delete ON attendance")
+    op.execute("DROP TRIGGER attendance_monthly_update ON attendance")
+    op.execute("DROP TRIGGER attendance_monthly_insert ON attendance")
+    op.execute("DROP FUNCTION attendance_monthly_rollup()")
+    op.drop_index('ix_attendance_monthly_month', table_name='attendance_monthly')
+    op.drop_table('attendance_monthly')
@@ -0,0 +1,187 @@
+"""add dashboard rollups
+
+Revision ID: f40d912d1004
+Revises: 186f1b2b3e61
+Create Date: 2026-10-17 10:41:55.310967
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f40d912d1004'
+down_revision: Union[str, None] = '186f1b2b3e61'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('department_headcount',
+    sa.Column('department', sa.String(length=100), nullable=False),
+    sa.Column('employee_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.PrimaryKeyConstraint('department')
+    )
+    op.create_table('attendance_daily_summary',
+    sa.Column('date', sa.Date(), nullable=False),
+    sa.Column('department', sa.String(length=100), nullable=False),
+    sa.Column('present_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.Column('absent_count', sa.Integer(), nullable=False, server_default='0'),
+    sa.PrimaryKeyConstraint('date', 'department')
+    )
+
+    # Statement-level triggers with transition tables: one grouped upsert per
+    # statement, so bulk writes (COPY, INSERT ... SELECT) stay cheap.
+    op.execute("""
+        CREATE FUNCTION employees_headcount_rollup() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN
+                INSERT INTO department_headcount (department, employee_count)
+                SELECT department, count(*) FROM new_rows GROUP BY department
+                ON CONFLICT (department) DO UPDATE
+                SET employee_count = department_headcount.employee_count + EXCLUDED.employee_count;
+            ELSIF TG_OP = 'DELETE' THEN
+                UPDATE department_headcount h
+                SET employee_count = h.employee_count - d.n
+                FROM (SELECT department, count(*) AS n FROM old_rows GROUP BY department) d
+                WHERE h.department = d.department;
+            ELSE
+                INSERT INTO department_headcount (department, employee_count)
+                SELECT department, sum(delta) FROM (
+                    SELECT department, 1 AS delta FROM new_rows
+                    UNION ALL
+                    SELECT department, -1 FROM old_rows
+                ) changes
+                GROUP BY department
+                ON CONFLICT (department) DO UPDATE
+                SET employee_count = department_headcount.employee_count + EXCLUDED.employee_count;
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER employees_headcount_insert AFTER INSERT ON employees
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION employees_headcount_rollup()
+    """)
+    op.execute("""
+        CREATE TRIGGER employees_headcount_update AFTER UPDATE ON employees
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION employees_headcount_rollup()
+    """)
+    op.execute("""
+        CREATE TRIGGER employees_headcount_delete AFTER DELETE ON employees
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION employees_headcount_rollup()
+    """)
+
+    # Transition tables only exist for the event that fired, so each branch
+    # names its own source rows.
+    attendance_changes = {
+        "INSERT": "SELECT employee_id, date, status, 1 AS delta FROM new_rows",
+        "DELETE": "SELECT employee_id, date, status, -1 AS delta FROM old_rows",
+        "UPDATE": (
+            "SELECT employee_id, date, status, 1 AS delta FROM new_rows "
+            "UNION ALL SELECT employee_id, date, status, -1 FROM old_rows"
+        ),
+    }
+    attendance_upsert = """
+                INSERT INTO attendance_daily_summary (date, department, present_count, absent_count)
+                SELECT c.date, e.department,
+                       COALESCE(sum(c.delta) FILTER (WHERE c.status = 'PRESENT'), 0),
+                       COALESCE(sum(c.delta) FILTER (WHERE c.status = 'ABSENT'), 0)
+                FROM ({changes}) c
+                JOIN employees e ON e.id = c.employee_id
+                GROUP BY c.date, e.department
+                ON CONFLICT (date, department) DO UPDATE
+                SET present_count = attendance_daily_summary.present_count + EXCLUDED.present_count,
+                    absent_count = attendance_daily_summary.absent_count + EXCLUDED.absent_count;"""
+    op.execute(f"""
+        CREATE FUNCTION attendance_daily_rollup() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            IF TG_OP = 'INSERT' THEN{attendance_upsert.format(changes=attendance_changes["INSERT"])}
+            ELSIF TG_OP = 'DELETE' THEN{attendance_upsert.format(changes=attendance_changes["DELETE"])}
+            ELSE{attendance_upsert.format(changes=attendance_changes["UPDATE"])}
+            END IF;
+            RETURN NULL;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_daily_insert AFTER INSERT ON attendance
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_daily_rollup()
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_daily_update AFTER UPDATE ON attendance
+        REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_daily_rollup()
+    """)
+    op.execute("""
+        CREATE TRIGGER attendance_daily_delete AFTER DELETE ON attendance
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION attendance_daily_rollup()
+    """)
+
+    # Attendance removed by ON DELETE CASCADE no longer joins to its employee,
+    # so take it out of the daily rollup before the employee row goes.
+    op.execute("""
+        CREATE FUNCTION employees_attendance_cleanup() RETURNS trigger
+        LANGUAGE plpgsql AS $$
+        BEGIN
+            UPDATE attendance_daily_summary s
+            SET present_count = s.present_count - a.present,
+                absent_count = s.absent_count - a.absent
+            FROM (
+                SELECT date,
+                       count(*) FILTER (WHERE status = 'PRESENT') AS present,
+                       count(*) FILTER (WHERE status = 'ABSENT') AS absent
+                FROM attendance WHERE employee_id = OLD.id
+                GROUP BY date
+            ) a
+            WHERE s.date = a.date AND s.department = OLD.department;
+            RETURN OLD;
+        END;
+        $$
+    """)
+    op.execute("""
+        CREATE TRIGGER employees_attendance_cleanup BEFORE DELETE ON employees
+        FOR EACH ROW EXECUTE FUNCTION employees_attendance_cleanup()
+    """)
+
+    # Backfill from existing data
+    op.execute("""
+        INSERT INTO department_headcount (department, employee_count)
+        SELECT department, count(*) FROM employees GROUP BY department
+    """)
+    op.execute("""
+        INSERT INTO attendance_daily_summary (date, department, present_count, absent_count)
+        SELECT a.date, e.department,
+               count(*) FILTER (WHERE a.status = 'PRESENT'),
+               count(*) FILTER (WHERE a.status = 'ABSENT')
+        FROM attendance a
+        JOIN employees e ON e.id = a.employee_id
+        GROUP BY a.date, e.department
+    """)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.execute("DROP TRIGGER employees_attendance_cleanup ON employees")
+    op.execute("DROP TRIGGER attendance_daily_delete ON attendance")
+    op.execute("DROP TRIGGER attendance_daily_update ON attendance")
+    op.execute("DROP TRIGGER attendance_daily_insert ON attendance")
+    op.execute("DROP TRIGGER employees_headcount_delete ON employees")
+    op.execute("DROP TRIGGER employees_headcount_update ON employees")
+    op.execute("DROP TRIGGER employees_headcount_insert ON employees")
+    op.execute("DROP FUNCTION employees_attendance_cleanup()")
+    op.execute("DROP FUNCTION attendance_daily_rollup()")
+    op.execute("DROP FUNCTION employees_headcount_rollup()")
+    op.drop_table('attendance_daily_summary')
+    op.drop_table('department_headcount')
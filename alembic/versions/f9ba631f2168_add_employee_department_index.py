@@ -0,0 +1,28 @@
+"""add employee department index
+
+Revision ID: f9ba631f2168
+Revises: e175ae760f50
+Create Date: 2026-10-17 09:12:41.204518
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f9ba631f2168'
+down_revision: Union[str, None] = 'e175ae760f50'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_employees_department_id', 'employees', ['department', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_employees_department_id', table_name='employees')
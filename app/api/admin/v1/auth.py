@@ -1,19 +1,19 @@
 from fastapi import APIRouter, Depends, Form, Request
-from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
 from app.helpers.utils import get_lang_from_request
 from app.models.enums import OtpTypeEnum, RoleTypeEnum
 from app.schemas.user import SendOtp, ForgetPassword, ResetPassword, VerifyOtp
 from app.crud import user as crud_user
-from app.db.session import get_db
+from app.db.session import get_async_db
 from app.core.security import *
 from app.helpers.response import ResponseHandler  # import your custom response handler
-from app.helpers.translator import Translator
+from app.helpers.translator import get_translator
 from fastapi.encoders import jsonable_encoder # type: ignore
 
 import logging
 logger = logging.getLogger(__name__)
 
-translator = Translator()
+translator = get_translator()
 
 router = APIRouter(
     prefix="/api/admin/v1/auth",
@@ -25,17 +25,27 @@ class LoginForm:
         self.phone_number = phone_number
 
 @router.post("/login")
-def login_user(
+async def login_user(
     request: Request,
     form_data: LoginForm = Depends(),
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     lang = get_lang_from_request(request)
     try:
-        user = crud_user.get_user_by_email_or_phone(db, form_data.phone_number)
-        if not user or not (verify_username_password(form_data.password, user.password)):
+        user = await crud_user.get_user_by_email_or_phone_async(db, form_data.phone_number)
+        if not user:
             return ResponseHandler.unauthorized(message=translator.t("invalid_credentials", lang))
 
+        # bcrypt runs once, on the dedicated hashing executor
+        valid, new_hash = await verify_and_update_password(form_data.password, user.password)
+        if not valid:
+            return ResponseHandler.unauthorized(message=translator.t("invalid_credentials", lang))
+
+        # Transparently upgrade hashes made with outdated settings
+        if new_hash:
+            user.password = new_hash
+            await db.commit()
+
         access_token = create_access_token(data={"sub": str(user.id)})
 
         # Case 4: User inactive
@@ -52,5 +62,10 @@ def login_user(
             message=translator.t("login_success", lang)
         )
 
+    except PasswordHashingBusy:
+        response = ResponseHandler.internal_error(message=translator.t("server_busy", lang), code=503)
+        response.headers["Retry-After"] = "1"
+        return response
+
     except Exception as e:
         return ResponseHandler.bad_request(message=translator.t("login_failed", lang), error=str(e))
@@ -1,47 +1,62 @@
-from fastapi import APIRouter, Depends, Request, File, UploadFile
-from psycopg2 import IntegrityError
+from datetime import date
+from typing import Optional
+from fastapi import APIRouter, Depends, Query, Request, File, UploadFile
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from app.core.dependencies import get_current_user
-from app.helpers.response import ResponseHandler
+from app.core.dependencies import get_current_user_async
+from app.helpers.response import ResponseHandler, dump_json
 from app.helpers.s3 import upload_file_to_s3
 from app.helpers.utils import get_lang_from_request
 from app.models import User
-from app.db.session import get_db
-from app.helpers.translator import Translator
+from app.db.session import get_async_db, get_db
+from app.helpers.translator import get_translator
 from app.crud import user as crud_user
+from app.crud import employee as crud_employee
+from app.crud import attendance as crud_attendance
+from app.crud import dashboard as crud_dashboard
+from app.crud import data_version as crud_data_version
+from app.helpers.etag import build_etag, etag_matches, not_modified, with_etag
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import StreamingResponse
+from sqlalchemy import select
+from app.helpers.export import EXPORT_MEDIA_TYPES, stream_export
 
 from app.models.employee import Attendance, Employee
-from app.schemas.employee import AttendanceCreate, EmployeeCreate
+from app.schemas.employee import (
+    AttendanceBulkCreate,
+    AttendanceCreate,
+    AttendanceListAdapter,
+    AttendanceRosterCreate,
+    EmployeeCreate,
+    EmployeeListAdapter,
+)
 
-translator = Translator()
+translator = get_translator()
 
 router = APIRouter(
     prefix="/api/admin/v1/hrms",
     tags=["User"],
-    dependencies=[Depends(get_current_user)]
+    dependencies=[Depends(get_current_user_async)]
 )
 @router.post("/employees")
-def create_employee(
+async def create_employee(
     request: Request,
     data: EmployeeCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     lang = get_lang_from_request(request)
 
     try:
-        employee_code = generate_employee_code(db)
-
         employee = Employee(
-            employee_code=employee_code,
             full_name=data.full_name,
             email=data.email,
             department=data.department
         )
 
+        # employee_code comes from the sequence default and is returned by the INSERT
         db.add(employee)
-        db.commit()
-        db.refresh(employee)
+        await db.commit()
 
         return ResponseHandler.success(
             data=jsonable_encoder(employee),
@@ -49,31 +64,73 @@ def create_employee(
         )
 
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         return ResponseHandler.bad_request(
             message="employee_exists"
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return ResponseHandler.internal_error(
             message=translator.t("something_went_wrong", lang),
             error=str(e)
         )
-@router.get("/employees")
-def list_employees(
+@router.post("/employees/import")
+def import_employees(
     request: Request,
+    file: UploadFile = File(...),
     db: Session = Depends(get_db),
 ):
     lang = get_lang_from_request(request)
 
     try:
-        employees = db.query(Employee).all()
+        summary = crud_employee.import_employees_csv(db, file.file)
+        db.commit()
 
         return ResponseHandler.success(
-            data=jsonable_encoder(employees)
+            data=summary,
+            message="employees_imported"
+        )
+
+    except ValueError as e:
+        db.rollback()
+        return ResponseHandler.bad_request(
+            message="invalid_csv",
+            error=str(e)
+        )
+
+    except Exception as e:
+        db.rollback()
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
+@router.get("/employees")
+async def list_employees(
+    request: Request,
+    limit: int = Query(crud_employee.DEFAULT_PAGE_SIZE, ge=1, le=crud_employee.MAX_PAGE_SIZE),
+    after: Optional[int] = Query(None, description="Cursor: id of the last employee on the previous page"),
+    department: Optional[str] = None,
+    db: AsyncSession = Depends(get_async_db),
+):
+    lang = get_lang_from_request(request)
+
+    try:
+        version = await crud_data_version.get_version_token(db, [crud_data_version.EMPLOYEES_SCOPE])
+        etag = build_etag(request, version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        employees, next_cursor = await crud_employee.list_employees_page(
+            db, limit=limit, after=after, department=department
         )
 
+        return with_etag(ResponseHandler.success_json(
+            data=dump_json(EmployeeListAdapter, employees),
+            meta={"limit": limit, "next_cursor": next_cursor}
+        ), etag)
+
     except Exception as e:
         return ResponseHandler.internal_error(
             message=translator.t("something_went_wrong", lang),
@@ -81,59 +138,56 @@ def list_employees(
         )
 
 @router.delete("/employees/{employee_id}")
-def delete_employee(
+async def delete_employee(
     request: Request,
     employee_id: int,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     lang = get_lang_from_request(request)
 
     try:
-        employee = db.query(Employee).filter(
-            Employee.id == employee_id
-        ).first()
+        employee = await db.get(Employee, employee_id)
 
         if not employee:
             return ResponseHandler.not_found(
                 message="employee_not_found"
             )
 
-        db.delete(employee)
-        db.commit()
+        # Attendance rows go with the ON DELETE CASCADE (passive_deletes)
+        await db.delete(employee)
+        await db.commit()
 
         return ResponseHandler.success(
             message="employee_deleted"
         )
 
     except Exception as e:
-        db.rollback()
+        await db.rollback()
         return ResponseHandler.internal_error(
             message=translator.t("something_went_wrong", lang),
             error=str(e)
         )
 
 @router.post("/attendance")
-def mark_attendance(
+async def mark_attendance(
     request: Request,
     data: AttendanceCreate,
-    db: Session = Depends(get_db),
+    db: AsyncSession = Depends(get_async_db),
 ):
     lang = get_lang_from_request(request)
 
     try:
-        employee = db.query(Employee).filter(
-            Employee.id == data.employee_id
-        ).first()
+        employee = await db.get(Employee, data.employee_id)
 
         if not employee:
             return ResponseHandler.not_found(
                 message="employee_not_found"
             )
 
+        # id comes back through INSERT ... RETURNING; no refresh needed
         attendance = Attendance(**data.model_dump())
         db.add(attendance)
-        db.commit()
-        db.refresh(attendance)
+        await db.commit()
 
         return ResponseHandler.success(
             data=jsonable_encoder(attendance),
@@ -141,11 +195,67 @@ def mark_attendance(
         )
 
     except IntegrityError:
-        db.rollback()
+        await db.rollback()
         return ResponseHandler.bad_request(
             message="attendance_already_marked"
         )
 
+    except Exception as e:
+        await db.rollback()
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
+@router.post("/attendance/bulk")
+def mark_attendance_bulk(
+    request: Request,
+    data: AttendanceBulkCreate,
+    db: Session = Depends(get_db),
+):
+    lang = get_lang_from_request(request)
+
+    try:
+        results = crud_attendance.bulk_upsert_attendance(db, data.records)
+        db.commit()
+
+        return ResponseHandler.success(
+            data=jsonable_encoder(results),
+            message="attendance_marked"
+        )
+
+    except Exception as e:
+        db.rollback()
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
+@router.post("/attendance/roster")
+def mark_attendance_roster(
+    request: Request,
+    data: AttendanceRosterCreate,
+    db: Session = Depends(get_db),
+):
+    lang = get_lang_from_request(request)
+
+    try:
+        marked = crud_attendance.mark_roster(
+            db,
+            day=data.date,
+            status=data.status,
+            department=data.department,
+            exclude_ids=data.exclude_ids,
+            excluded_status=data.excluded_status,
+            overwrite=data.overwrite,
+        )
+        db.commit()
+
+        return ResponseHandler.success(
+            data={"date": data.date.isoformat(), "marked": marked},
+            message="attendance_marked"
+        )
+
     except Exception as e:
         db.rollback()
         return ResponseHandler.internal_error(
@@ -153,30 +263,123 @@ def mark_attendance(
             error=str(e)
         )
 
+@router.get("/attendance/monthly")
+def get_monthly_attendance(
+    request: Request,
+    employee_id: Optional[int] = None,
+    from_month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    to_month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$"),
+    db: Session = Depends(get_db),
+):
+    lang = get_lang_from_request(request)
+
+    # Without an employee, default to the current month to keep the result bounded
+    if employee_id is None and from_month is None and to_month is None:
+        from_month = to_month = date.today().strftime("%Y-%m")
+
+    try:
+        from_month, to_month = parse_month(from_month), parse_month(to_month)
+    except ValueError as e:
+        return ResponseHandler.bad_request(
+            message="invalid_month",
+            error=str(e)
+        )
+
+    try:
+        stats = crud_dashboard.get_monthly_stats(
+            db,
+            employee_id=employee_id,
+            from_month=from_month,
+            to_month=to_month,
+        )
+
+        return ResponseHandler.success(
+            data=stats
+        )
+
+    except Exception as e:
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
 @router.get("/attendance/{employee_id}")
-def get_attendance(
+async def get_attendance(
     request: Request,
     employee_id: int,
-    db: Session = Depends(get_db),
+    date_from: Optional[date] = Query(None, alias="from"),
+    date_to: Optional[date] = Query(None, alias="to"),
+    limit: int = Query(crud_attendance.DEFAULT_PAGE_SIZE, ge=1, le=crud_attendance.MAX_PAGE_SIZE),
+    before: Optional[date] = Query(None, description="Cursor: date of the last row on the previous page"),
+    month: Optional[str] = Query(None, pattern=r"^\d{4}-\d{2}$", description="Calendar mode: one entry per day"),
+    db: AsyncSession = Depends(get_async_db),
 ):
     lang = get_lang_from_request(request)
 
     try:
-        employee = db.query(Employee).filter(
-            Employee.id == employee_id
-        ).first()
+        month_start = parse_month(month)
+    except ValueError as e:
+        return ResponseHandler.bad_request(
+            message="invalid_month",
+            error=str(e)
+        )
+
+    try:
+        # employees scope too: deleting an employee without attendance must not 304
+        version = await crud_data_version.get_version_token(db, [
+            crud_data_version.EMPLOYEES_SCOPE,
+            crud_data_version.attendance_scope(employee_id),
+        ])
+        etag = build_etag(request, version)
+        if etag_matches(request, etag):
+            return not_modified(etag)
+
+        employee = await db.get(Employee, employee_id)
 
         if not employee:
             return ResponseHandler.not_found(
                 message="employee_not_found"
             )
 
-        attendance = db.query(Attendance).filter(
-            Attendance.employee_id == employee_id
-        ).order_by(Attendance.date.desc()).all()
+        if month_start:
+            days = await crud_attendance.get_attendance_calendar(db, employee_id, month_start)
+            return with_etag(ResponseHandler.success(
+                data=days,
+                meta={"month": month}
+            ), etag)
+
+        attendance, next_cursor = await crud_attendance.list_attendance_page(
+            db,
+            employee_id,
+            date_from=date_from,
+            date_to=date_to,
+            before=before,
+            limit=limit,
+        )
+
+        return with_etag(ResponseHandler.success_json(
+            data=dump_json(AttendanceListAdapter, attendance),
+            meta={"limit": limit, "next_cursor": next_cursor.isoformat() if next_cursor else None}
+        ), etag)
+
+    except Exception as e:
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
+@router.get("/dashboard/summary")
+def dashboard_summary(
+    request: Request,
+    db: Session = Depends(get_db),
+):
+    lang = get_lang_from_request(request)
+
+    try:
+        summary = crud_dashboard.get_dashboard_summary(db, date.today())
 
         return ResponseHandler.success(
-            data=jsonable_encoder(attendance)
+            data=summary
         )
 
     except Exception as e:
@@ -185,13 +388,71 @@ def get_attendance(
             error=str(e)
         )
 
-def generate_employee_code(db: Session) -> str:
-    last_employee = db.query(Employee).order_by(Employee.id.desc()).first()
+@router.get("/export/employees")
+def export_employees(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    department: Optional[str] = None,
+):
+    lang = get_lang_from_request(request)
 
-    if not last_employee:
-        return "EMP001"
+    try:
+        columns = ["id", "employee_code", "full_name", "email", "department"]
+        stmt = select(
+            Employee.id,
+            Employee.employee_code,
+            Employee.full_name,
+            Employee.email,
+            Employee.department,
+        ).order_by(Employee.id)
+        if department:
+            stmt = stmt.where(Employee.department == department)
+
+        return StreamingResponse(
+            stream_export(stmt, columns, format),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="employees.{format}"'}
+        )
 
-    last_number = int(last_employee.employee_code.replace("EMP", ""))
-    new_number = last_number + 1
+    except Exception as e:
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
+@router.get("/export/attendance")
+def export_attendance(
+    request: Request,
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    employee_id: Optional[int] = None,
+):
+    lang = get_lang_from_request(request)
+
+    try:
+        columns = ["id", "employee_id", "date", "status"]
+        stmt = select(
+            Attendance.id,
+            Attendance.employee_id,
+            Attendance.date,
+            Attendance.status,
+        ).order_by(Attendance.id)
+        if employee_id is not None:
+            stmt = stmt.where(Attendance.employee_id == employee_id)
+
+        return StreamingResponse(
+            stream_export(stmt, columns, format),
+            media_type=EXPORT_MEDIA_TYPES[format],
+            headers={"Content-Disposition": f'attachment; filename="attendance.{format}"'}
+        )
+
+    except Exception as e:
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
 
-    return f"EMP{new_number:03d}"
\ No newline at end of file
+def parse_month(value: Optional[str]) -> Optional[date]:
+    if not value:
+        return None
+    year, month = value.split("-")
+    return date(int(year), int(month), 1)
@@ -0,0 +1,25 @@
+from fastapi import APIRouter, Depends, Request
+from app.core.dependencies import get_current_user_async
+from app.db.session import get_pool_status
+from app.helpers.response import ResponseHandler
+from app.helpers.utils import get_lang_from_request
+from app.helpers.translator import get_translator
+
+translator = get_translator()
+
+router = APIRouter(
+    prefix="/api/admin/v1/system",
+    tags=["System"],
+    dependencies=[Depends(get_current_user_async)]
+)
+
+@router.get("/db-pool")
+async def db_pool_status(request: Request):
+    lang = get_lang_from_request(request)
+    try:
+        return ResponseHandler.success(data=get_pool_status())
+    except Exception as e:
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
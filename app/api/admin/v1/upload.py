@@ -0,0 +1,200 @@
+from typing import Optional
+from fastapi import APIRouter, Depends, File, Form, Request, UploadFile
+from sqlalchemy.orm import Session
+from app.core.dependencies import get_current_user
+from app.crud import upload as crud_upload
+from app.db.session import get_db
+from app.helpers.background_upload import UploadQueueFull, start_background_upload
+from app.helpers.response import ResponseHandler
+from app.helpers.s3 import (
+    UPLOAD_MAX_BYTES,
+    build_s3_key,
+    delete_s3_object,
+    generate_presigned_upload,
+    head_s3_object,
+    s3_object_url,
+)
+from app.helpers.translator import get_translator
+from app.helpers.utils import get_lang_from_request
+from app.models import User
+from app.schemas.upload import UploadPresignRequest
+
+translator = get_translator()
+
+router = APIRouter(
+    prefix="/api/admin/v1/uploads",
+    tags=["Uploads"],
+    dependencies=[Depends(get_current_user)]
+)
+
+def serialize_upload(upload) -> dict:
+    data = {
+        "upload_id": upload.id,
+        "key": upload.key,
+        "status": upload.status,
+        "size": upload.size,
+        "bytes_transferred": upload.bytes_transferred,
+        "progress": round(100 * upload.bytes_transferred / upload.size, 1) if upload.size else None,
+        "content_type": upload.content_type,
+        "error": upload.error,
+    }
+    if upload.status == "uploaded":
+        data["url"] = s3_object_url(upload.key)
+    return data
+
+@router.post("")
+def upload_file(
+    request: Request,
+    file: UploadFile = File(...),
+    folder: Optional[str] = Form(None, pattern=r"^[\w-]+$", max_length=50),
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    """
+    Proxy upload: the file is spooled to local disk and the S3 transfer runs on
+    the background upload pool. Responds 202; poll GET /uploads/{upload_id}.
+    """
+    lang = get_lang_from_request(request)
+
+    try:
+        upload = start_background_upload(db, file, folder=folder, user_id=current_user.id)
+
+        return ResponseHandler.success(
+            data=serialize_upload(upload),
+            message="upload_accepted",
+            code=202
+        )
+
+    except UploadQueueFull:
+        response = ResponseHandler.internal_error(message=translator.t("server_busy", lang), code=503)
+        response.headers["Retry-After"] = "5"
+        return response
+
+    except ValueError as e:
+        return ResponseHandler.bad_request(
+            message="file_too_large",
+            error={"max_size": UPLOAD_MAX_BYTES, "detail": str(e)}
+        )
+
+    except Exception as e:
+        db.rollback()
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
+@router.get("/{upload_id}")
+def get_upload_status(
+    request: Request,
+    upload_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    lang = get_lang_from_request(request)
+
+    try:
+        upload = crud_upload.get_upload(db, upload_id, current_user.id)
+        if not upload:
+            return ResponseHandler.not_found(message="upload_not_found")
+
+        return ResponseHandler.success(data=serialize_upload(upload))
+
+    except Exception as e:
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
+@router.post("/presign")
+def presign_upload(
+    request: Request,
+    data: UploadPresignRequest,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    lang = get_lang_from_request(request)
+
+    try:
+        if data.size > UPLOAD_MAX_BYTES:
+            return ResponseHandler.bad_request(
+                message="file_too_large",
+                error={"max_size": UPLOAD_MAX_BYTES}
+            )
+
+        key = build_s3_key(data.filename, data.content_type, data.folder)
+        upload = crud_upload.create_upload(
+            db,
+            key=key,
+            filename=data.filename,
+            content_type=data.content_type,
+            max_size=data.size,
+            user_id=current_user.id,
+        )
+        # Signing is local computation; the client sends the bytes to the bucket
+        presigned = generate_presigned_upload(key, data.content_type, data.size, data.method)
+        db.commit()
+
+        return ResponseHandler.success(
+            data={"upload_id": upload.id, "key": key, **presigned},
+            message="upload_url_created"
+        )
+
+    except Exception as e:
+        db.rollback()
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
+
+@router.post("/{upload_id}/confirm")
+def confirm_upload(
+    request: Request,
+    upload_id: int,
+    current_user: User = Depends(get_current_user),
+    db: Session = Depends(get_db),
+):
+    lang = get_lang_from_request(request)
+
+    try:
+        upload = crud_upload.get_upload(db, upload_id, current_user.id)
+        if not upload:
+            return ResponseHandler.not_found(message="upload_not_found")
+
+        if upload.status in ("queued", "uploading", "failed"):
+            # Server-side transfers finish on their own; nothing to confirm
+            return ResponseHandler.bad_request(
+                message="upload_not_pending",
+                data=serialize_upload(upload)
+            )
+
+        if upload.status == "pending":
+            stored = head_s3_object(upload.key)
+            if stored is None:
+                return ResponseHandler.bad_request(message="upload_not_received")
+
+            # A presigned PUT cannot bound the size, so enforce the declared
+            # size and type here and drop objects that do not match
+            if stored["size"] > upload.max_size or stored["content_type"] != upload.content_type:
+                delete_s3_object(upload.key)
+                return ResponseHandler.bad_request(
+                    message="upload_rejected",
+                    error={
+                        "expected": {"max_size": upload.max_size, "content_type": upload.content_type},
+                        "received": stored,
+                    }
+                )
+
+            crud_upload.mark_uploaded(db, upload, stored["size"])
+            db.commit()
+
+        return ResponseHandler.success(
+            data=serialize_upload(upload),
+            message="upload_confirmed"
+        )
+
+    except Exception as e:
+        db.rollback()
+        return ResponseHandler.internal_error(
+            message=translator.t("something_went_wrong", lang),
+            error=str(e)
+        )
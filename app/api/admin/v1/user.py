@@ -3,10 +3,10 @@ from app.core.dependencies import get_current_user
 from app.helpers.response import ResponseHandler
 from app.helpers.utils import get_lang_from_request
 from app.models import User
-from app.helpers.translator import Translator
+from app.helpers.translator import get_translator
 from fastapi.encoders import jsonable_encoder
 
-translator = Translator()
+translator = get_translator()
 
 router = APIRouter(
     prefix="/api/admin/v1/user",
@@ -0,0 +1,63 @@
+import hmac
+from fastapi import APIRouter, Request
+from fastapi.responses import PlainTextResponse
+from app.core.config import settings
+from app.core.dependencies import user_cache
+from app.core.security import token_cache
+from app.db.session import get_pool_status
+from app.helpers.metrics import registry
+
+# Prometheus text exposition format
+CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+POOL_GAUGES = {
+    "size": "Configured pool size.",
+    "checked_out": "Connections currently checked out.",
+    "checked_in": "Idle connections in the pool.",
+    "overflow": "Overflow connections currently open.",
+}
+POOL_COUNTERS = {
+    "checkouts": "Successful connection checkouts.",
+    "timeouts": "Checkouts that timed out waiting for a connection.",
+    "wait_seconds_total": "Total time spent waiting for a connection.",
+}
+CACHES = {"user": user_cache, "jwt": token_cache}
+
+router = APIRouter(include_in_schema=False)
+
+
+def db_pool_metrics():
+    pools = get_pool_status()
+    for key, documentation in POOL_GAUGES.items():
+        yield (f"db_pool_{key}", "gauge", documentation, ("pool",),
+               {(pool,): status[key] for pool, status in pools.items()})
+    for key, documentation in POOL_COUNTERS.items():
+        name = f"db_pool_{key}" if key.endswith("_total") else f"db_pool_{key}_total"
+        yield (name, "counter", documentation, ("pool",),
+               {(pool,): status.get(key, 0) for pool, status in pools.items()})
+
+
+def cache_metrics():
+    stats = {name: cache.stats() for name, cache in CACHES.items()}
+    yield ("cache_hits_total", "counter", "Cache hits.", ("cache",),
+           {(name,): s["hits"] for name, s in stats.items()})
+    yield ("cache_misses_total", "counter", "Cache misses.", ("cache",),
+           {(name,): s["misses"] for name, s in stats.items()})
+    yield ("cache_evictions_total", "counter", "Entries evicted to stay within maxsize.", ("cache",),
+           {(name,): s["evictions"] for name, s in stats.items()})
+    yield ("cache_entries", "gauge", "Entries currently cached.", ("cache",),
+           {(name,): s["size"] for name, s in stats.items()})
+
+
+registry.register_collector(db_pool_metrics)
+registry.register_collector(cache_metrics)
+
+
+@router.get("/metrics")
+def metrics(request: Request):
+    # Optional shared secret for the scraper; unset means open, as usual for /metrics
+    if settings.METRICS_TOKEN and not hmac.compare_digest(
+        request.headers.get("authorization", "").encode(), f"Bearer {settings.METRICS_TOKEN}".encode()
+    ):
+        return PlainTextResponse("unauthorized\n", status_code=401)
+    return PlainTextResponse(registry.expose(), media_type=CONTENT_TYPE)
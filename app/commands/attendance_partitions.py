@@ -0,0 +1,60 @@
+"""
+Maintain the monthly partitions of the attendance table.
+
+The API also runs `ensure` on startup and every
+ATTENDANCE_PARTITION_CHECK_SECONDS (default daily) while it is up; use this
+command for one-off runs, e.g. from a cron job when the API is not deployed.
+
+Usage:
+    python -m app.commands.attendance_partitions ensure [--months-ahead 3]
+    python -m app.commands.attendance_partitions list
+    python -m app.commands.attendance_partitions archive --before 2024-01-01
+"""
+import argparse
+import logging
+from datetime import date
+from app.db.partitions import (
+    ATTENDANCE_MONTHS_AHEAD,
+    archive_attendance_partitions,
+    ensure_attendance_partitions,
+    list_attendance_partitions,
+)
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    ensure = sub.add_parser("ensure", help="create partitions for upcoming months")
+    ensure.add_argument("--months-ahead", type=int, default=ATTENDANCE_MONTHS_AHEAD)
+
+    sub.add_parser("list", help="show attached monthly partitions")
+
+    archive = sub.add_parser("archive", help="detach partitions that end on or before a date")
+    archive.add_argument("--before", type=date.fromisoformat, required=True)
+
+    args = parser.parse_args()
+
+    with SessionLocal() as db:
+        try:
+            if args.command == "ensure":
+                created = ensure_attendance_partitions(db, args.months_ahead)
+                logger.info("Created %d attendance partition(s)", created)
+            elif args.command == "list":
+                for partition in list_attendance_partitions(db):
+                    print(partition["name"], partition["bound"])
+            else:
+                archived = archive_attendance_partitions(db, args.before)
+                logger.info("Archived %s", ", ".join(archived) or "nothing")
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
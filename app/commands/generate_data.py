@@ -0,0 +1,285 @@
+"""
+Generate synthetic employees, attendance, users and user OTPs for load
+testing, bulk-loaded with COPY (no ORM objects).
+
+Output is deterministic for a given --seed and set of options. Rows are
+written in batches of --batch-size; attendance batches are produced day by
+day so each COPY lands in one or two monthly partitions, and the rollup /
+version triggers run once per batch.
+
+Generated emails and usernames start with --prefix, so re-running with the
+same options needs --truncate (or another prefix).
+
+Usage:
+    python -m app.commands.generate_data [--employees 10000]
+        [--from 2025-01-01] [--to 2025-12-31] [--present-ratio 0.9] [--coverage 1.0]
+        [--departments Engineering Sales ...] [--users 1000] [--otps-per-user 2]
+        [--seed 42] [--batch-size 500000] [--prefix synthetic] [--truncate]
+"""
+import argparse
+import io
+import logging
+import random
+import time
+from datetime import date, timedelta
+from typing import Iterable, List, Optional, Sequence
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.commands.rebuild_rollups import rebuild_rollups
+from app.core.security import get_password_hash
+from app.crud.employee import allocate_employee_codes
+from app.db.partitions import ensure_attendance_partitions
+from app.db.session import SessionLocal
+from app.models.enums import OtpTypeEnum, RoleTypeEnum
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_DEPARTMENTS = [
+    "Engineering", "Sales", "Marketing", "Finance", "Operations", "Support",
+    "Human Resources", "Legal", "Product", "Design", "Procurement", "Facilities",
+]
+DEFAULT_BATCH_SIZE = 500_000
+USER_PASSWORD = "Synthetic@123"
+CREATED_AT = "2024-01-01 00:00:00+00"
+
+
+def _copy(db: Session, table: str, columns: Sequence[str], lines: List[str]) -> None:
+    """COPY tab-separated `lines` (each ending in a newline) into `table`."""
+    buffer = io.StringIO("".join(lines))
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(f"COPY {table} ({', '.join(columns)}) FROM STDIN", buffer)
+    finally:
+        cursor.close()
+
+
+def _reserve_ids(db: Session, sequence: str, count: int) -> List[int]:
+    """Take `count` ids from a serial sequence so COPY can write them explicitly."""
+    return list(db.execute(
+        text("SELECT nextval(CAST(:sequence AS regclass)) FROM generate_series(1, :count)"),
+        {"sequence": sequence, "count": count},
+    ).scalars())
+
+
+def _batches(items: Sequence, size: int) -> Iterable[Sequence]:
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+def truncate_tables(db: Session) -> None:
+    db.execute(text("TRUNCATE employees, user_otps, users RESTART IDENTITY CASCADE"))
+    db.commit()
+
+
+def generate_employees(
+    db: Session,
+    rng: random.Random,
+    count: int,
+    departments: Sequence[str],
+    prefix: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> List[int]:
+    """Returns the ids of the new employees."""
+    ids = []
+    for batch in _batches(range(count), batch_size):
+        batch_ids = _reserve_ids(db, "employees_id_seq", len(batch))
+        codes = allocate_employee_codes(db, len(batch))
+        lines = [
+            f"{employee_id}\t{code}\tEmployee {employee_id}\t"
+            f"{prefix}.employee{employee_id}@example.com\t{rng.choice(departments)}\n"
+            for employee_id, code in zip(batch_ids, codes)
+        ]
+        _copy(db, "employees", ("id", "employee_code", "full_name", "email", "department"), lines)
+        db.commit()
+        ids.extend(batch_ids)
+    return ids
+
+
+def generate_attendance(
+    db: Session,
+    rng: random.Random,
+    employee_ids: Sequence[int],
+    date_from: date,
+    date_to: date,
+    present_ratio: float = 0.9,
+    coverage: float = 1.0,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    One record per employee per day in [date_from, date_to], skipping a
+    (1 - coverage) share of employee-days. Returns the number of rows.
+    """
+    first_month = date_from.replace(day=1)
+    today = date.today()
+    months_ahead = max(0, (date_to.year - today.year) * 12 + date_to.month - today.month)
+    ensure_attendance_partitions(db, months_ahead, from_month=min(first_month, today))
+    db.commit()
+
+    columns = ("employee_id", "date", "status")
+    lines = []
+    total = 0
+    day = date_from
+    while day <= date_to:
+        day_text = day.isoformat()
+        for employee_id in employee_ids:
+            if coverage < 1.0 and rng.random() >= coverage:
+                continue
+            status = "PRESENT" if rng.random() < present_ratio else "ABSENT"
+            lines.append(f"{employee_id}\t{day_text}\t{status}\n")
+        if len(lines) >= batch_size:
+            _copy(db, "attendance", columns, lines)
+            db.commit()
+            total += len(lines)
+            logger.info("attendance: %d rows (through %s)", total, day_text)
+            lines = []
+        day += timedelta(days=1)
+
+    if lines:
+        _copy(db, "attendance", columns, lines)
+        db.commit()
+        total += len(lines)
+    return total
+
+
+def generate_users(
+    db: Session,
+    rng: random.Random,
+    count: int,
+    otps_per_user: int,
+    prefix: str,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+) -> int:
+    """
+    Users share one bcrypt hash of USER_PASSWORD (hashing per row would
+    dominate the run). Returns the number of OTP rows written.
+    """
+    password = get_password_hash(USER_PASSWORD)
+    roles = [role.value for role in RoleTypeEnum]
+    otp_types = [otp_type.value for otp_type in OtpTypeEnum]
+    otps = 0
+
+    for batch in _batches(range(count), batch_size):
+        user_ids = _reserve_ids(db, "users_id_seq", len(batch))
+        users = []
+        user_otps = []
+        for user_id in user_ids:
+            phone = f"9{rng.randrange(10 ** 9):09d}"
+            users.append(
+                f"{user_id}\tUser\t{user_id}\t{prefix}.user{user_id}@example.com\t+91\t{phone}\t"
+                f"t\tt\t{prefix}_user_{user_id}\t{password}\t{rng.choice(roles)}\t"
+                f"{CREATED_AT}\t{CREATED_AT}\tt\tf\n"
+            )
+            for _ in range(otps_per_user):
+                user_otps.append(
+                    f"{user_id}\t+91\t{phone}\t{rng.randrange(10 ** 6):06d}\t{rng.choice(otp_types)}\t"
+                    f"t\t{'t' if rng.random() < 0.8 else 'f'}\t{CREATED_AT}\t{CREATED_AT}\n"
+                )
+        _copy(db, "users", (
+            "id", "first_name", "last_name", "email", "isd_code", "phone_number",
+            "is_email_verified", "is_phone_verified", "username", "password", "role",
+            "created_at", "updated_at", "is_active", "is_deleted",
+        ), users)
+        if user_otps:
+            _copy(db, "user_otps", (
+                "user_id", "isd_code", "phone_number", "otp", "type",
+                "is_sent", "is_verified", "created_at", "updated_at",
+            ), user_otps)
+        db.commit()
+        otps += len(user_otps)
+    return otps
+
+
+def generate(
+    db: Session,
+    employees: int = 10_000,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    present_ratio: float = 0.9,
+    coverage: float = 1.0,
+    departments: Sequence[str] = DEFAULT_DEPARTMENTS,
+    users: int = 0,
+    otps_per_user: int = 0,
+    seed: int = 42,
+    batch_size: int = DEFAULT_BATCH_SIZE,
+    prefix: str = "synthetic",
+    truncate: bool = False,
+) -> dict:
+    """Generate the whole dataset and rebuild rollups. Returns row counts."""
+    date_to = date_to or date.today() - timedelta(days=1)
+    date_from = date_from or date_to - timedelta(days=364)
+    rng = random.Random(seed)
+
+    if truncate:
+        truncate_tables(db)
+
+    started = time.perf_counter()
+    employee_ids = generate_employees(db, rng, employees, departments, prefix, batch_size)
+    logger.info("employees: %d rows in %.1fs", len(employee_ids), time.perf_counter() - started)
+
+    started = time.perf_counter()
+    attendance = generate_attendance(
+        db, rng, employee_ids, date_from, date_to, present_ratio, coverage, batch_size
+    )
+    logger.info("attendance: %d rows in %.1fs", attendance, time.perf_counter() - started)
+
+    started = time.perf_counter()
+    otps = generate_users(db, rng, users, otps_per_user, prefix, batch_size) if users else 0
+    logger.info("users: %d rows, user_otps: %d rows in %.1fs", users, otps, time.perf_counter() - started)
+
+    db.execute(text("ANALYZE employees"))
+    db.execute(text("ANALYZE attendance"))
+    db.commit()
+    # Triggers kept the rollups current batch by batch; a truncate does not
+    rebuild_rollups()
+
+    return {"employees": len(employee_ids), "attendance": attendance, "users": users, "user_otps": otps}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--employees", type=int, default=10_000)
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, help="first attendance day")
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, help="last attendance day (default yesterday)")
+    parser.add_argument("--present-ratio", type=float, default=0.9)
+    parser.add_argument("--coverage", type=float, default=1.0, help="share of employee-days with a record")
+    parser.add_argument("--departments", nargs="+", default=DEFAULT_DEPARTMENTS)
+    parser.add_argument("--users", type=int, default=0)
+    parser.add_argument("--otps-per-user", type=int, default=0)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--batch-size", type=int, default=DEFAULT_BATCH_SIZE)
+    parser.add_argument("--prefix", default="synthetic")
+    parser.add_argument("--truncate", action="store_true", help="empty employees, attendance, users, user_otps (and rows referencing them) first")
+    args = parser.parse_args()
+
+    if not 0 <= args.present_ratio <= 1 or not 0 < args.coverage <= 1:
+        parser.error("--present-ratio must be in [0, 1] and --coverage in (0, 1]")
+    if args.date_from and args.date_to and args.date_from > args.date_to:
+        parser.error("--from must not be after --to")
+
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        try:
+            counts = generate(
+                db,
+                employees=args.employees,
+                date_from=args.date_from,
+                date_to=args.date_to,
+                present_ratio=args.present_ratio,
+                coverage=args.coverage,
+                departments=args.departments,
+                users=args.users,
+                otps_per_user=args.otps_per_user,
+                seed=args.seed,
+                batch_size=args.batch_size,
+                prefix=args.prefix,
+                truncate=args.truncate,
+            )
+        except Exception:
+            db.rollback()
+            raise
+    logger.info("Generated %s in %.1fs", counts, time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    main()
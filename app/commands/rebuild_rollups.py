@@ -0,0 +1,58 @@
+"""
+Recompute the trigger-maintained rollup tables from employees/attendance.
+
+Usage:
+    python -m app.commands.rebuild_rollups
+"""
+import logging
+import time
+from sqlalchemy import text
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+REBUILD_STATEMENTS = [
+    # Block writers so triggers cannot apply deltas mid-rebuild
+    "LOCK TABLE employees, attendance IN SHARE MODE",
+    "TRUNCATE department_headcount, attendance_daily_summary, attendance_monthly",
+    """
+    INSERT INTO department_headcount (department, employee_count)
+    SELECT department, count(*) FROM employees GROUP BY department
+    """,
+    """
+    INSERT INTO attendance_daily_summary (date, department, present_count, absent_count)
+    SELECT a.date, e.department,
+           count(*) FILTER (WHERE a.status = 'PRESENT'),
+           count(*) FILTER (WHERE a.status = 'ABSENT')
+    FROM attendance a
+    JOIN employees e ON e.id = a.employee_id
+    GROUP BY a.date, e.department
+    """,
+    """
+    INSERT INTO attendance_monthly (employee_id, month, present_days, absent_days)
+    SELECT employee_id, date_trunc('month', date)::date,
+           count(*) FILTER (WHERE status = 'PRESENT'),
+           count(*) FILTER (WHERE status = 'ABSENT')
+    FROM attendance
+    WHERE employee_id IS NOT NULL
+    GROUP BY employee_id, date_trunc('month', date)
+    """,
+]
+
+
+def rebuild_rollups() -> None:
+    started = time.perf_counter()
+    with SessionLocal() as db:
+        try:
+            for statement in REBUILD_STATEMENTS:
+                db.execute(text(statement))
+            db.commit()
+        except Exception:
+            db.rollback()
+            raise
+    logger.info("Rollups rebuilt in %.2fs", time.perf_counter() - started)
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    rebuild_rollups()
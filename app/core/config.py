@@ -1,4 +1,5 @@
 # app/core/config.py
+from typing import Optional
 from pydantic_settings import BaseSettings # type: ignore
 
 class Settings(BaseSettings):
@@ -21,8 +22,13 @@ class Settings(BaseSettings):
     POSTGRES_DB:str
     
     ADMIN_BYPASS_OTP:str
+
+    # Bearer token required on /metrics when set
+    METRICS_TOKEN: Optional[str] = None
     
     class Config:
         env_file = ".env"
+        # .env also carries DB_*/SQL_* (app.db.config) and os.getenv-read options
+        extra = "ignore"
 
 settings = Settings()
@@ -1,34 +1,124 @@
+import os
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
-from jose import jwt, JWTError # type: ignore
-from app.db.session import get_db
+from jose import JWTError # type: ignore
+from app.db.session import get_async_db, get_db
+from app.helpers.cache import TTLCache
 from app.models import User
-from app.core.security import SECRET_KEY, ALGORITHM, oauth2_scheme
+from app.core.security import decode_access_token_cached, oauth2_scheme
 
+USER_CACHE_TTL_SECONDS = float(os.getenv("USER_CACHE_TTL_SECONDS", 60))
+USER_CACHE_MAX_SIZE = int(os.getenv("USER_CACHE_MAX_SIZE", 1024))
 
-def get_current_user(
-    token: str = Depends(oauth2_scheme),
-    db: Session = Depends(get_db)
-) -> User:
-    credentials_exception = HTTPException(
+# What auth and the routes read from the current user (/me returns these).
+# Never the password hash or other columns nobody reads.
+USER_SNAPSHOT_FIELDS = (
+    "id", "first_name", "last_name", "email", "isd_code", "phone_number",
+    "is_email_verified", "is_phone_verified", "username", "role",
+    "is_active", "is_deleted", "profile_image",
+)
+
+# user id (str, as in the token's "sub") -> USER_SNAPSHOT_FIELDS of the User row
+user_cache = TTLCache(maxsize=USER_CACHE_MAX_SIZE, ttl=USER_CACHE_TTL_SECONDS)
+
+
+def invalidate_user(user_id) -> None:
+    """Drop a cached user, e.g. after it is deactivated or deleted."""
+    user_cache.pop(str(user_id))
+
+
+# Invalidate on commit, not at flush: a request running between the flush and
+# the commit still reads the old committed row and would cache it again.
+@event.listens_for(Session, "after_flush")
+def _collect_written_users(session, flush_context):
+    # dirty/deleted still hold the pre-flush state here
+    written = session.info.setdefault("written_user_ids", set())
+    written.update(
+        obj.id for obj in (*session.dirty, *session.deleted)
+        if isinstance(obj, User) and obj.id is not None
+    )
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_written_users(session):
+    for user_id in session.info.pop("written_user_ids", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_written_users(session):
+    session.info.pop("written_user_ids", None)
+
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
+
+
+def _user_id_from_token(token: str) -> str:
     try:
-        payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        print("Payload ",payload)
-        user_id: int = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
+        payload = decode_access_token_cached(token)
+        user_id = payload.get("sub")
     except JWTError:
-        raise credentials_exception
+        raise _credentials_exception()
+    if user_id is None or not str(user_id).isdigit():
+        raise _credentials_exception()
+    return str(user_id)
+
+
+def _cache_user(user: User) -> User:
+    """Cache a snapshot of `user` and return it as a detached User."""
+    snapshot = {field: getattr(user, field) for field in USER_SNAPSHOT_FIELDS}
+    user_cache.set(str(user.id), snapshot)
+    return User(**snapshot)
+
+
+def get_current_user(
+    token: str = Depends(oauth2_scheme),
+    db: Session = Depends(get_db)
+) -> User:
+    user_id = _user_id_from_token(token)
+
+    # Cache hit: rebuild a detached User from the snapshot without touching the DB
+    snapshot = user_cache.get(user_id)
+    if snapshot is not None:
+        return User(**snapshot)
 
     user = db.query(User).filter(
         User.id == user_id,
         User.is_deleted == False
     ).first()
     if not user:
-        raise credentials_exception
-    return user
+        raise _credentials_exception()
+    # Same shape as a cache hit, so responses do not depend on the cache
+    return _cache_user(user)
+
+
+async def get_current_user_async(
+    token: str = Depends(oauth2_scheme),
+    db: AsyncSession = Depends(get_async_db)
+) -> User:
+    """
+    Same as get_current_user, for async routers: runs on the event loop and
+    only checks out an async-pool connection on a cache miss.
+    """
+    user_id = _user_id_from_token(token)
+
+    snapshot = user_cache.get(user_id)
+    if snapshot is not None:
+        return User(**snapshot)
+
+    user = await db.scalar(select(User).where(
+        User.id == int(user_id),
+        User.is_deleted == False
+    ))
+    if not user:
+        raise _credentials_exception()
+    # Same shape as a cache hit, so responses do not depend on the cache
+    return _cache_user(user)
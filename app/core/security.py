@@ -6,13 +6,38 @@ from fastapi import Depends, HTTPException
 from app.db.session import get_db
 from app.models import User
 import os
+import asyncio
+import hashlib
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Tuple
 from fastapi.security import OAuth2PasswordBearer
+from app.helpers.cache import TTLCache
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 SECRET_KEY = os.getenv("SECRET_KEY", "your-default-secret-key")
 ALGORITHM = os.getenv("ALGORITHM", "HS256")
 ACCESS_TOKEN_EXPIRE_MINUTES = int(os.getenv("ACCESS_TOKEN_EXPIRE_MINUTES", 180))
+JWT_CACHE_MAX_SIZE = int(os.getenv("JWT_CACHE_MAX_SIZE", 4096))
+PASSWORD_HASH_WORKERS = int(os.getenv("PASSWORD_HASH_WORKERS", min(4, os.cpu_count() or 1)))
+PASSWORD_HASH_MAX_PENDING = int(os.getenv("PASSWORD_HASH_MAX_PENDING", PASSWORD_HASH_WORKERS * 8))
+
+# bcrypt releases the GIL, so a few dedicated threads hash in parallel without
+# touching Starlette's request threadpool. The semaphore caps queued + running
+# work so a login burst is rejected quickly instead of piling up.
+password_hash_executor = ThreadPoolExecutor(
+    max_workers=PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+)
+_password_hash_slots = threading.BoundedSemaphore(PASSWORD_HASH_MAX_PENDING)
+
+
+class PasswordHashingBusy(Exception):
+    """Raised when the password-hashing queue is full."""
+
+# sha256(token) -> verified claims, kept until the token's own "exp"
+token_cache = TTLCache(maxsize=JWT_CACHE_MAX_SIZE, ttl=300)
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="admin/login")
 
@@ -22,9 +47,27 @@ def get_password_hash(password: str) -> str:
 
 def verify_username_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a plain password against the hashed password."""
-    print(pwd_context.verify(plain_password, hashed_password))
     return pwd_context.verify(plain_password, hashed_password)
 
+async def verify_and_update_password(plain_password: str, hashed_password: str) -> Tuple[bool, Optional[str]]:
+    """
+    Verify once on the password-hashing executor.
+    Returns (valid, new_hash); new_hash is set when the stored hash uses
+    outdated settings and should be replaced. Raises PasswordHashingBusy
+    when PASSWORD_HASH_MAX_PENDING verifications are already in flight.
+    """
+    if not _password_hash_slots.acquire(blocking=False):
+        raise PasswordHashingBusy()
+    try:
+        future = password_hash_executor.submit(pwd_context.verify_and_update, plain_password, hashed_password)
+    except Exception:
+        _password_hash_slots.release()
+        raise
+    # Free the slot when bcrypt is done, not when this coroutine is: a
+    # cancelled request leaves the hash running on the executor
+    future.add_done_callback(lambda _: _password_hash_slots.release())
+    return await asyncio.wrap_future(future)
+
 def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
     """Create a JWT access token."""
     to_encode = data.copy()
@@ -34,4 +77,20 @@ def create_access_token(data: dict, expires_delta: timedelta = None) -> str:
 
 def decode_access_token(token: str) -> dict:
     payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-    return payload
\ No newline at end of file
+    return payload
+
+def decode_access_token_cached(token: str) -> dict:
+    """
+    Same as decode_access_token, but remembers verified claims until the
+    token expires so repeat requests skip signature verification.
+    Raises JWTError for invalid tokens (failures are never cached).
+    """
+    key = hashlib.sha256(token.encode()).digest()
+    payload = token_cache.get(key)
+    if payload is not None:
+        return payload
+
+    payload = decode_access_token(token)
+    exp = payload.get("exp")
+    token_cache.set(key, payload, ttl=exp - time.time() if exp is not None else None)
+    return payload
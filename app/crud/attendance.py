@@ -0,0 +1,172 @@
+import calendar
+from datetime import date, timedelta
+from typing import Dict, List, Optional, Tuple
+from sqlalchemy import Date, Integer, String, case, column, literal, literal_column, select, values
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.models.employee import Attendance, Employee
+from app.schemas.employee import AttendanceCreate, AttendanceStatus
+
+DEFAULT_PAGE_SIZE = 100
+MAX_PAGE_SIZE = 1000
+
+
+def bulk_upsert_attendance(db: Session, records: List[AttendanceCreate]) -> List[Dict]:
+    """
+    Mark attendance for many (employee_id, date) pairs in one statement.
+
+    Rows are upserted on the unique_employee_date constraint; rows whose
+    employee does not exist are dropped by the join and reported back.
+    Returns one result per input record, in input order. Does not commit.
+    """
+    # ON CONFLICT cannot touch the same row twice in one statement, so the
+    # last record for a given (employee_id, date) wins.
+    latest: Dict[tuple, int] = {}
+    for index, record in enumerate(records):
+        latest[(record.employee_id, record.date)] = index
+
+    source = values(
+        column("employee_id", Integer),
+        column("date", Date),
+        column("status", String),
+        name="v",
+    ).data([
+        (records[i].employee_id, records[i].date, records[i].status.value)
+        for i in latest.values()
+    ])
+
+    stmt = pg_insert(Attendance).from_select(
+        ["employee_id", "date", "status"],
+        select(source.c.employee_id, source.c.date, source.c.status)
+        .join(Employee, Employee.id == source.c.employee_id),
+    )
+    stmt = stmt.on_conflict_do_update(
+        constraint="unique_employee_date",
+        set_={"status": stmt.excluded.status},
+    ).returning(
+        Attendance.id,
+        Attendance.employee_id,
+        Attendance.date,
+        Attendance.status,
+        literal_column("(xmax = 0)").label("inserted"),
+    )
+
+    written = {
+        (row.employee_id, row.date): row
+        for row in db.execute(stmt)
+    }
+
+    results = []
+    for index, record in enumerate(records):
+        key = (record.employee_id, record.date)
+        row = written.get(key)
+        if latest[key] != index:
+            result = "superseded"
+        elif row is None:
+            result = "employee_not_found"
+        else:
+            result = "created" if row.inserted else "updated"
+        results.append({
+            "index": index,
+            "id": row.id if row is not None and result != "superseded" else None,
+            "employee_id": record.employee_id,
+            "date": record.date,
+            "status": record.status.value,
+            "result": result,
+        })
+    return results
+
+
+def mark_roster(
+    db: Session,
+    day: date,
+    status: AttendanceStatus,
+    department: Optional[str] = None,
+    exclude_ids: Optional[List[int]] = None,
+    excluded_status: Optional[AttendanceStatus] = None,
+    overwrite: bool = False,
+) -> int:
+    """
+    Mark every employee (optionally within one department) for `day` with a
+    single INSERT ... SELECT FROM employees. Excluded ids are skipped, or
+    marked with `excluded_status` when given. Existing rows are kept unless
+    `overwrite` is set. Returns the number of rows written. Does not commit.
+    """
+    exclude_ids = exclude_ids or []
+
+    status_expr = literal(status.value, String)
+    if exclude_ids and excluded_status is not None:
+        status_expr = case(
+            (Employee.id.in_(exclude_ids), literal(excluded_status.value, String)),
+            else_=status_expr,
+        )
+
+    source = select(Employee.id, literal(day, Date), status_expr)
+    if department:
+        source = source.where(Employee.department == department)
+    if exclude_ids and excluded_status is None:
+        source = source.where(Employee.id.not_in(exclude_ids))
+
+    stmt = pg_insert(Attendance).from_select(["employee_id", "date", "status"], source)
+    if overwrite:
+        stmt = stmt.on_conflict_do_update(
+            constraint="unique_employee_date",
+            set_={"status": stmt.excluded.status},
+        )
+    else:
+        stmt = stmt.on_conflict_do_nothing(constraint="unique_employee_date")
+
+    return db.execute(stmt).rowcount
+
+
+async def list_attendance_page(
+    db: AsyncSession,
+    employee_id: int,
+    date_from: Optional[date] = None,
+    date_to: Optional[date] = None,
+    before: Optional[date] = None,
+    limit: int = DEFAULT_PAGE_SIZE,
+) -> Tuple[List[Attendance], Optional[date]]:
+    """
+    Newest-first page of one employee's attendance. Every filter is a range
+    on the (employee_id, date) unique index, so only the page is read.
+    Returns the rows and the cursor (date) for the next page.
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    stmt = select(Attendance).where(Attendance.employee_id == employee_id)
+    if date_from is not None:
+        stmt = stmt.where(Attendance.date >= date_from)
+    if date_to is not None:
+        stmt = stmt.where(Attendance.date <= date_to)
+    if before is not None:
+        stmt = stmt.where(Attendance.date < before)
+
+    rows = (await db.scalars(stmt.order_by(Attendance.date.desc()).limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].date
+
+    return rows, next_cursor
+
+
+async def get_attendance_calendar(db: AsyncSession, employee_id: int, month: date) -> List[Dict]:
+    """One entry per day of `month` (first day of the month), status None when unmarked."""
+    days_in_month = calendar.monthrange(month.year, month.month)[1]
+    last_day = month + timedelta(days=days_in_month - 1)
+
+    marked = dict((await db.execute(
+        select(Attendance.date, Attendance.status).where(
+            Attendance.employee_id == employee_id,
+            Attendance.date >= month,
+            Attendance.date <= last_day,
+        )
+    )).all())
+
+    return [
+        {"date": day.isoformat(), "status": marked.get(day)}
+        for day in (month + timedelta(days=offset) for offset in range(days_in_month))
+    ]
@@ -0,0 +1,78 @@
+from datetime import date
+from typing import Dict, List, Optional
+from sqlalchemy.orm import Session
+from app.models.dashboard import AttendanceDailySummary, AttendanceMonthly, DepartmentHeadcount
+
+
+def get_dashboard_summary(db: Session, day: date) -> Dict:
+    """
+    Build the dashboard summary from the rollup tables only; cost depends on
+    the number of departments, not on employees or attendance history.
+    """
+    headcounts = db.query(DepartmentHeadcount).filter(
+        DepartmentHeadcount.employee_count > 0
+    ).all()
+    daily = {
+        row.department: row
+        for row in db.query(AttendanceDailySummary).filter(
+            AttendanceDailySummary.date == day
+        ).all()
+    }
+
+    departments = []
+    for headcount in sorted(headcounts, key=lambda h: h.department):
+        today = daily.get(headcount.department)
+        present = today.present_count if today else 0
+        absent = today.absent_count if today else 0
+        departments.append({
+            "department": headcount.department,
+            "total_employees": headcount.employee_count,
+            "present": present,
+            "absent": absent,
+            "unmarked": max(headcount.employee_count - present - absent, 0),
+        })
+
+    total = sum(d["total_employees"] for d in departments)
+    present = sum(d["present"] for d in departments)
+    absent = sum(d["absent"] for d in departments)
+    return {
+        "date": day.isoformat(),
+        "total_employees": total,
+        "present_today": present,
+        "absent_today": absent,
+        "unmarked_today": max(total - present - absent, 0),
+        "departments": departments,
+    }
+
+
+def get_monthly_stats(
+    db: Session,
+    employee_id: Optional[int] = None,
+    from_month: Optional[date] = None,
+    to_month: Optional[date] = None,
+) -> List[Dict]:
+    """
+    Per-employee monthly attendance stats read from attendance_monthly.
+    Months are identified by their first day.
+    """
+    query = db.query(AttendanceMonthly)
+    if employee_id is not None:
+        query = query.filter(AttendanceMonthly.employee_id == employee_id)
+    if from_month is not None:
+        query = query.filter(AttendanceMonthly.month >= from_month)
+    if to_month is not None:
+        query = query.filter(AttendanceMonthly.month <= to_month)
+
+    stats = []
+    for row in query.order_by(AttendanceMonthly.employee_id, AttendanceMonthly.month).all():
+        marked = row.present_days + row.absent_days
+        if marked == 0:
+            continue
+        stats.append({
+            "employee_id": row.employee_id,
+            "month": row.month.strftime("%Y-%m"),
+            "present_days": row.present_days,
+            "absent_days": row.absent_days,
+            "attendance_rate": round(row.present_days / marked, 4),
+        })
+    return stats
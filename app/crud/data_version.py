@@ -0,0 +1,37 @@
+from typing import List
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from app.models.data_version import DataVersion
+
+EMPLOYEES_SCOPE = "employees"
+
+# Scopes whose trigger spreads bumps over "<scope>#<n>" rows so concurrent
+# writers do not queue on one row lock (alembic revision 4af81efe883e)
+EMPLOYEES_VERSION_SHARDS = 16
+SHARDED_SCOPES = {EMPLOYEES_SCOPE: EMPLOYEES_VERSION_SHARDS}
+
+
+def attendance_scope(employee_id: int) -> str:
+    return f"attendance:{employee_id}"
+
+
+def _scope_rows(scope: str) -> List[str]:
+    # The unsharded row is kept: it holds the count from before sharding
+    shards = SHARDED_SCOPES.get(scope, 0)
+    return [scope] + [f"{scope}#{n}" for n in range(shards)]
+
+
+async def get_version_token(db: AsyncSession, scopes: List[str]) -> str:
+    """
+    Combined version of one or more scopes in a single primary-key lookup,
+    e.g. "12.4". Sharded scopes are summed; scopes that were never written
+    count as 0.
+    """
+    wanted = {row: scope for scope in scopes for row in _scope_rows(scope)}
+    totals = dict.fromkeys(scopes, 0)
+    rows = (await db.execute(
+        select(DataVersion.scope, DataVersion.version).where(DataVersion.scope.in_(list(wanted)))
+    )).all()
+    for row_scope, version in rows:
+        totals[wanted[row_scope]] += version
+    return ".".join(str(totals[scope]) for scope in scopes)
@@ -0,0 +1,153 @@
+import csv
+import io
+from typing import BinaryIO, Dict, List, Optional, Tuple
+from pydantic import ValidationError
+from sqlalchemy import select, text
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+from app.models.employee import Employee
+from app.schemas.employee import EmployeeCreate
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+
+
+async def list_employees_page(
+    db: AsyncSession,
+    limit: int = DEFAULT_PAGE_SIZE,
+    after: Optional[int] = None,
+    department: Optional[str] = None,
+) -> Tuple[List[Employee], Optional[int]]:
+    """
+    Keyset page of employees ordered by id.
+    Returns the rows and the cursor for the next page (None on the last page).
+    """
+    limit = max(1, min(limit, MAX_PAGE_SIZE))
+
+    stmt = select(Employee)
+    if department:
+        stmt = stmt.where(Employee.department == department)
+    if after is not None:
+        stmt = stmt.where(Employee.id > after)
+
+    # Fetch one extra row to know whether another page exists
+    rows = (await db.scalars(stmt.order_by(Employee.id.asc()).limit(limit + 1))).all()
+
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = rows[-1].id
+
+    return rows, next_cursor
+
+
+IMPORT_BATCH_SIZE = 1000
+IMPORT_COLUMNS = ("full_name", "email", "department")
+
+
+def allocate_employee_codes(db: Session, count: int) -> List[str]:
+    """
+    Reserve a block of `count` employee codes from employee_code_seq in a
+    single round trip. Codes are unique but may leave gaps on rollback.
+    """
+    return list(db.execute(
+        text("SELECT format_employee_code(nextval('employee_code_seq')) FROM generate_series(1, :count)"),
+        {"count": count},
+    ).scalars())
+
+
+def import_employees_csv(db: Session, fileobj: BinaryIO) -> Dict:
+    """
+    Stream a CSV of employees (full_name, email, department) into the
+    employees table. Rows are validated against EmployeeCreate and loaded
+    in batches through COPY into a temp table followed by one
+    INSERT ... SELECT ... ON CONFLICT DO NOTHING per batch.
+    Returns counts plus per-row errors (line numbers are 1-based, header
+    is line 1). Does not commit.
+    """
+    reader = csv.DictReader(io.TextIOWrapper(fileobj, encoding="utf-8-sig", newline=""))
+    missing = [col for col in IMPORT_COLUMNS if col not in (reader.fieldnames or [])]
+    if missing:
+        raise ValueError(f"missing columns: {', '.join(missing)}")
+
+    db.execute(text(
+        "CREATE TEMP TABLE IF NOT EXISTS employee_import ("
+        " line integer, employee_code varchar(50), full_name varchar(150),"
+        " email varchar(150), department varchar(100)"
+        ") ON COMMIT DROP"
+    ))
+
+    summary = {"total": 0, "created": 0, "errors": []}
+    seen_emails = set()
+    batch = []
+
+    for line, row in enumerate(reader, start=2):
+        summary["total"] += 1
+        try:
+            employee = EmployeeCreate(**{col: (row.get(col) or "").strip() for col in IMPORT_COLUMNS})
+        except ValidationError as e:
+            summary["errors"].append({
+                "line": line,
+                "email": row.get("email"),
+                "error": "; ".join(f"{'.'.join(map(str, err['loc']))}: {err['msg']}" for err in e.errors()),
+            })
+            continue
+
+        email = employee.email.lower()
+        if email in seen_emails:
+            summary["errors"].append({"line": line, "email": employee.email, "error": "duplicate_email_in_file"})
+            continue
+        seen_emails.add(email)
+
+        batch.append((line, employee))
+        if len(batch) >= IMPORT_BATCH_SIZE:
+            _load_employee_batch(db, batch, summary)
+            batch = []
+
+    if batch:
+        _load_employee_batch(db, batch, summary)
+
+    return summary
+
+
+def _load_employee_batch(db: Session, batch: List[Tuple[int, EmployeeCreate]], summary: Dict) -> None:
+    codes = allocate_employee_codes(db, len(batch))
+
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    for (line, employee), code in zip(batch, codes):
+        writer.writerow([line, code, employee.full_name, employee.email, employee.department])
+    buffer.seek(0)
+
+    db.execute(text("TRUNCATE employee_import"))
+    cursor = db.connection().connection.cursor()
+    try:
+        cursor.copy_expert(
+            "COPY employee_import (line, employee_code, full_name, email, department) "
+            "FROM STDIN WITH (FORMAT csv)",
+            buffer,
+        )
+    finally:
+        cursor.close()
+
+    inserted = set(db.execute(text(
+        "INSERT INTO employees (employee_code, full_name, email, department) "
+        "SELECT employee_code, full_name, email, department FROM employee_import ORDER BY line "
+        "ON CONFLICT DO NOTHING "
+        "RETURNING email"
+    )).scalars())
+    summary["created"] += len(inserted)
+
+    rejected = [(line, employee) for line, employee in batch if employee.email not in inserted]
+    if not rejected:
+        return
+
+    existing = set(db.execute(
+        select(Employee.email).where(Employee.email.in_([employee.email for _, employee in rejected]))
+    ).scalars())
+    for line, employee in rejected:
+        summary["errors"].append({
+            "line": line,
+            "email": employee.email,
+            "error": "email_exists" if employee.email in existing else "employee_code_exists",
+        })
@@ -0,0 +1,70 @@
+from datetime import datetime, timezone
+from typing import Optional
+from sqlalchemy import func
+from sqlalchemy.orm import Session
+from app.models.upload import FileUpload
+
+
+def create_upload(
+    db: Session,
+    key: str,
+    filename: str,
+    content_type: str,
+    max_size: int,
+    user_id: Optional[int] = None,
+    status: str = "pending",
+    size: Optional[int] = None,
+) -> FileUpload:
+    upload = FileUpload(
+        key=key,
+        filename=filename,
+        content_type=content_type,
+        max_size=max_size,
+        size=size,
+        status=status,
+        uploaded_by=user_id,
+    )
+    db.add(upload)
+    db.flush()
+    return upload
+
+
+def get_upload(db: Session, upload_id: int, user_id: int) -> Optional[FileUpload]:
+    return db.query(FileUpload).filter(
+        FileUpload.id == upload_id,
+        FileUpload.uploaded_by == user_id
+    ).first()
+
+
+def mark_uploaded(db: Session, upload: FileUpload, size: int) -> FileUpload:
+    upload.size = size
+    upload.bytes_transferred = size
+    upload.status = "uploaded"
+    upload.confirmed_at = datetime.now(timezone.utc)
+    db.flush()
+    return upload
+
+
+def set_upload_status(db: Session, upload_id: int, status: str, **values) -> None:
+    """Single-statement UPDATE, used by the background transfer thread."""
+    if status == "uploaded":
+        values.setdefault("confirmed_at", datetime.now(timezone.utc))
+    db.query(FileUpload).filter(FileUpload.id == upload_id).update(
+        {"status": status, **values}, synchronize_session=False
+    )
+
+
+def fail_stale_uploads(db: Session, created_before: datetime, error: str) -> int:
+    """Mark server-side transfers still queued/uploading since before `created_before` as failed."""
+    return db.query(FileUpload).filter(
+        FileUpload.status.in_(("queued", "uploading")),
+        FileUpload.created_at < created_before
+    ).update({"status": "failed", "error": error}, synchronize_session=False)
+
+
+def set_upload_progress(db: Session, upload_id: int, bytes_transferred: int) -> None:
+    # GREATEST: progress callbacks from parallel part uploads may commit out of order
+    db.query(FileUpload).filter(FileUpload.id == upload_id).update(
+        {"bytes_transferred": func.greatest(FileUpload.bytes_transferred, bytes_transferred)},
+        synchronize_session=False
+    )
@@ -1,16 +1,29 @@
 import random
 import string
+from sqlalchemy import select, union_all
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 from app.models.user import User
 from app.core.security import *
 from app.models.enums import RoleTypeEnum
 
+def user_by_identifier_stmt(data: str):
+    """
+    Login lookup as two single-column probes, username first, so each side
+    uses its partial index on non-deleted users instead of an OR filter.
+    """
+    by_username = select(User).where(User.username == data, User.is_deleted == False).limit(1)
+    by_phone = select(User).where(User.phone_number == data, User.is_deleted == False).limit(1)
+    return select(User).from_statement(union_all(by_username, by_phone).limit(1))
+
+
 def get_user_by_email_or_phone(db:Session,data:str):
-    return db.query(User).filter(
-                    ((User.username == data) | (User.phone_number == data)),
-                    User.is_deleted == False
-                ).first()
-            
+    return db.scalar(user_by_identifier_stmt(data))
+
+
+async def get_user_by_email_or_phone_async(db: AsyncSession, data: str):
+    return await db.scalar(user_by_identifier_stmt(data))
+
 
 def get_user_by_id(db: Session, user_id: int):
     return db.query(User).filter(
@@ -0,0 +1,29 @@
+# app/db/config.py
+from pydantic_settings import BaseSettings # type: ignore
+
+
+class DatabaseSettings(BaseSettings):
+    """
+    Engine and SQL-instrumentation options only. Kept apart from
+    app.core.config.Settings so that importing the DB layer (commands,
+    alembic, benchmarks) needs DATABASE_URL but none of the app secrets.
+    """
+
+    # Connection pool (applies to the sync and the async engine separately)
+    DB_POOL_SIZE: int = 5
+    DB_MAX_OVERFLOW: int = 10
+    DB_POOL_TIMEOUT: float = 30
+    DB_POOL_RECYCLE: int = 1800
+    DB_POOL_PRE_PING: bool = True
+    DB_ECHO: bool = False
+
+    # Per-request SQL instrumentation
+    SQL_SLOW_QUERY_MS: float = 200
+    SQL_REPEAT_THRESHOLD: int = 5
+    SQL_DEBUG_HEADERS: bool = False
+
+    class Config:
+        env_file = ".env"
+        extra = "ignore"
+
+db_settings = DatabaseSettings()
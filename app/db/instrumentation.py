@@ -0,0 +1,58 @@
+import logging
+import time
+from collections import Counter
+from contextvars import ContextVar
+from typing import Optional
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from app.db.config import db_settings
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStats:
+    """Statements issued while serving one request."""
+
+    def __init__(self):
+        self.count = 0
+        self.total_seconds = 0.0
+        self.statements = Counter()
+
+    def record(self, statement: str, elapsed: float) -> None:
+        self.count += 1
+        self.total_seconds += elapsed
+        self.statements[statement] += 1
+
+    def repeated(self, threshold: int):
+        """Statements executed at least `threshold` times (likely N+1 loops)."""
+        return [(sql, n) for sql, n in self.statements.most_common() if n >= threshold]
+
+
+current_query_stats: ContextVar[Optional[QueryStats]] = ContextVar("current_query_stats", default=None)
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Kept on the per-statement context: a statement that raises never reaches
+    # after_cursor_execute, and its start time is discarded with the context
+    if context is not None:
+        context._query_start_time = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = getattr(context, "_query_start_time", None)
+    if started is None:
+        return
+    elapsed = time.perf_counter() - started
+
+    stats = current_query_stats.get()
+    if stats is not None:
+        stats.record(statement, elapsed)
+
+    if elapsed * 1000 >= db_settings.SQL_SLOW_QUERY_MS:
+        logger.warning("Slow query (%.1f ms): %s", elapsed * 1000, statement)
+
+
+def instrument_engine(engine: Engine) -> None:
+    """Attach timing hooks to a (sync) engine; use async_engine.sync_engine for async."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
@@ -0,0 +1,101 @@
+import asyncio
+import logging
+import os
+from datetime import date
+from typing import List, Optional
+from sqlalchemy import text
+from sqlalchemy.orm import Session
+from app.db.session import SessionLocal
+
+logger = logging.getLogger(__name__)
+
+ATTENDANCE_MONTHS_AHEAD = 3
+ATTENDANCE_PARTITION_CHECK_SECONDS = float(os.getenv("ATTENDANCE_PARTITION_CHECK_SECONDS", 24 * 3600))
+
+
+def ensure_attendance_partitions(
+    db: Session,
+    months_ahead: int = ATTENDANCE_MONTHS_AHEAD,
+    from_month: Optional[date] = None,
+) -> int:
+    """
+    Create monthly attendance partitions from the current month (or
+    `from_month`, for backfills) up to `months_ahead` months out (see
+    ensure_attendance_partitions() in alembic revisions 0e3540c43c07 and
+    1e964c623cfe). Concurrent callers are serialized by an advisory lock held
+    until the transaction ends.
+    Returns how many were created.
+    """
+    return db.execute(
+        text("SELECT ensure_attendance_partitions(:months_ahead, :from_month)"),
+        {"months_ahead": months_ahead, "from_month": from_month},
+    ).scalar()
+
+
+def ensure_upcoming_attendance_partitions() -> int:
+    """ensure_attendance_partitions() in its own committed transaction."""
+    with SessionLocal() as db:
+        created = ensure_attendance_partitions(db)
+        db.commit()
+    return created
+
+
+async def maintain_attendance_partitions(interval: float = ATTENDANCE_PARTITION_CHECK_SECONDS) -> None:
+    """
+    Keep ATTENDANCE_MONTHS_AHEAD months of partitions ahead of the calendar
+    for as long as the process runs, checking every `interval` seconds, so
+    new rows never fall through to attendance_default. Runs until cancelled.
+    """
+    while True:
+        try:
+            created = await asyncio.to_thread(ensure_upcoming_attendance_partitions)
+            if created:
+                logger.info("Created %d attendance partition(s)", created)
+        except Exception:
+            logger.exception("Could not ensure attendance partitions")
+        await asyncio.sleep(interval)
+
+
+def list_attendance_partitions(db: Session) -> List[dict]:
+    """Attached monthly partitions with their lower bound, oldest first."""
+    rows = db.execute(text("""
+        SELECT child.relname AS name,
+               pg_get_expr(child.relpartbound, child.oid) AS bound
+        FROM pg_inherits
+        JOIN pg_class parent ON parent.oid = pg_inherits.inhparent
+        JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+        WHERE parent.relname = 'attendance'
+          AND child.relname LIKE 'attendance\\_y%'
+        ORDER BY child.relname
+    """)).all()
+    return [
+        {"name": row.name, "month": date(int(row.name[12:16]), int(row.name[17:19]), 1), "bound": row.bound}
+        for row in rows
+    ]
+
+
+def archive_attendance_partitions(db: Session, before: date) -> List[str]:
+    """
+    Detach monthly partitions that end on or before `before` and rename them
+    to attendance_archive_yYYYYmMM. The archived rows leave the attendance
+    table without firing delete triggers, so dashboard/monthly rollups keep
+    their history (a later rebuild_rollups would drop it). Cached attendance
+    reads are invalidated by bumping every attendance version.
+    Returns the archive table names. Does not commit.
+    """
+    archived = []
+    for partition in list_attendance_partitions(db):
+        month = partition["month"]
+        next_month = date(month.year + month.month // 12, month.month % 12 + 1, 1)
+        if next_month > before:
+            continue
+        archive_name = partition["name"].replace("attendance_", "attendance_archive_", 1)
+        db.execute(text(f'ALTER TABLE attendance DETACH PARTITION "{partition["name"]}"'))
+        db.execute(text(f'ALTER TABLE "{partition["name"]}" RENAME TO "{archive_name}"'))
+        archived.append(archive_name)
+
+    if archived:
+        db.execute(text(
+            "UPDATE data_versions SET version = version + 1 WHERE scope LIKE 'attendance:%'"
+        ))
+    return archived
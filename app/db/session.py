@@ -1,20 +1,71 @@
 from sqlalchemy import create_engine
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, Session
 from dotenv import load_dotenv
+from typing import AsyncIterator, Dict
 import os
+from app.db.config import db_settings
+from app.db.instrumentation import instrument_engine
+from app.db.pool import TimedAsyncAdaptedQueuePool, TimedQueuePool, pool_status
 
 load_dotenv()
 
 DATABASE_URL = os.getenv("DATABASE_URL")
 
-engine = create_engine(DATABASE_URL, echo=True)
+ENGINE_OPTIONS = dict(
+    echo=db_settings.DB_ECHO,
+    pool_size=db_settings.DB_POOL_SIZE,
+    max_overflow=db_settings.DB_MAX_OVERFLOW,
+    pool_timeout=db_settings.DB_POOL_TIMEOUT,
+    pool_recycle=db_settings.DB_POOL_RECYCLE,
+    pool_pre_ping=db_settings.DB_POOL_PRE_PING,
+)
+
+engine = create_engine(DATABASE_URL, poolclass=TimedQueuePool, **ENGINE_OPTIONS)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 
+def _async_database_url(url: str):
+    """Point DATABASE_URL at asyncpg, translating libpq-only query options."""
+    url = make_url(url)
+    query = dict(url.query)
+    if "sslmode" in query:
+        query["ssl"] = query.pop("sslmode")
+    query.pop("channel_binding", None)
+    return url.set(drivername="postgresql+asyncpg", query=query)
+
+
+async_engine = create_async_engine(
+    _async_database_url(DATABASE_URL), poolclass=TimedAsyncAdaptedQueuePool, **ENGINE_OPTIONS
+)
+instrument_engine(engine)
+instrument_engine(async_engine.sync_engine)
+
+# expire_on_commit=False: attributes cannot be lazily reloaded outside the event loop
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine, class_=AsyncSession, autoflush=False, expire_on_commit=False
+)
+
+
+def get_pool_status() -> Dict[str, Dict]:
+    """Current occupancy and checkout wait times of both connection pools."""
+    return {
+        "sync": pool_status(engine.pool),
+        "async": pool_status(async_engine.pool),
+    }
+
+
 # Dependency
 def get_db() -> Session:
     db = SessionLocal()
     try:
         yield db
     finally:
-        db.close()
\ No newline at end of file
+        db.close()
+
+
+# Async dependency
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    async with AsyncSessionLocal() as db:
+        yield db
@@ -0,0 +1,201 @@
+import glob
+import logging
+import os
+import shutil
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+from typing import BinaryIO, Tuple
+from fastapi import UploadFile
+from sqlalchemy.orm import Session
+from app.crud import upload as crud_upload
+from app.db.session import SessionLocal
+from app.helpers.s3 import UPLOAD_MAX_BYTES, AWS_BUCKET_NAME, build_s3_key, get_s3_client, resolve_content_type
+from app.models.upload import FileUpload
+
+logger = logging.getLogger(__name__)
+
+UPLOAD_WORKERS = int(os.getenv("UPLOAD_WORKERS", 4))
+UPLOAD_MAX_PENDING = int(os.getenv("UPLOAD_MAX_PENDING", UPLOAD_WORKERS * 8))
+UPLOAD_SPOOL_DIR = os.getenv("UPLOAD_SPOOL_DIR") or None
+UPLOAD_PROGRESS_INTERVAL_SECONDS = float(os.getenv("UPLOAD_PROGRESS_INTERVAL_SECONDS", 1.0))
+# Transfers older than this cannot still be running in any live worker
+UPLOAD_STALE_SECONDS = float(os.getenv("UPLOAD_STALE_SECONDS", 3600))
+
+# Multipart above 8 MiB; each transfer uploads a few parts in parallel on
+# boto3's own threads, so UPLOAD_WORKERS bounds whole objects, not parts.
+TRANSFER_OPTIONS = dict(
+    multipart_threshold=8 * 1024 * 1024,
+    multipart_chunksize=8 * 1024 * 1024,
+    max_concurrency=4,
+)
+
+# Same shape as the password-hashing pool: a few dedicated threads, and a
+# semaphore over queued + running transfers so spool space stays bounded.
+upload_executor = ThreadPoolExecutor(max_workers=UPLOAD_WORKERS, thread_name_prefix="s3-upload")
+_upload_slots = threading.BoundedSemaphore(UPLOAD_MAX_PENDING)
+
+
+class UploadQueueFull(Exception):
+    """Raised when UPLOAD_MAX_PENDING transfers are already queued or running."""
+
+
+class _TransferProgress:
+    """
+    boto3 transfer callback. Invoked from the part-upload threads with byte
+    deltas; persists the running total at most once per interval.
+    """
+
+    def __init__(self, upload_id: int):
+        self.upload_id = upload_id
+        self.transferred = 0
+        self._last_flush = 0.0
+        self._lock = threading.Lock()
+
+    def __call__(self, bytes_amount: int) -> None:
+        with self._lock:
+            self.transferred += bytes_amount
+            now = time.monotonic()
+            if now - self._last_flush < UPLOAD_PROGRESS_INTERVAL_SECONDS:
+                return
+            self._last_flush = now
+            transferred = self.transferred
+
+        try:
+            with SessionLocal() as db:
+                crud_upload.set_upload_progress(db, self.upload_id, transferred)
+                db.commit()
+        except Exception:
+            # Progress is informational; never fail the transfer over it
+            logger.warning("Could not record progress of upload %s", self.upload_id, exc_info=True)
+
+
+def _spool(source: BinaryIO) -> Tuple[str, int]:
+    """Copy the request body to a named temp file that outlives the request."""
+    source.seek(0)
+    with tempfile.NamedTemporaryFile(prefix="upload-", dir=UPLOAD_SPOOL_DIR, delete=False) as spooled:
+        try:
+            shutil.copyfileobj(source, spooled, length=1024 * 1024)
+        except Exception:
+            os.remove(spooled.name)
+            raise
+        return spooled.name, spooled.tell()
+
+
+def _set_status(upload_id: int, status: str, **values) -> None:
+    with SessionLocal() as db:
+        crud_upload.set_upload_status(db, upload_id, status, **values)
+        db.commit()
+
+
+def _transfer(upload_id: int, path: str, key: str, content_type: str, size: int) -> None:
+    from boto3.s3.transfer import TransferConfig
+
+    try:
+        _set_status(upload_id, "uploading")
+        get_s3_client().upload_file(
+            Filename=path,
+            Bucket=AWS_BUCKET_NAME,
+            Key=key,
+            ExtraArgs={"ContentType": content_type},
+            Config=TransferConfig(**TRANSFER_OPTIONS),
+            Callback=_TransferProgress(upload_id),
+        )
+        _set_status(upload_id, "uploaded", bytes_transferred=size)
+    except Exception as e:
+        logger.exception("Background upload %s failed", upload_id)
+        try:
+            _set_status(upload_id, "failed", error=str(e))
+        except Exception:
+            logger.exception("Could not mark upload %s as failed", upload_id)
+    finally:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+        _upload_slots.release()
+
+
+def start_background_upload(
+    db: Session,
+    upload_file: UploadFile,
+    folder: str = None,
+    user_id: int = None,
+) -> FileUpload:
+    """
+    Spool `upload_file` to disk, record a queued upload and hand the S3
+    transfer to the upload pool. Returns as soon as the row is committed;
+    poll the row's status/bytes_transferred for progress.
+    Raises UploadQueueFull when the pool is saturated and ValueError when
+    the file exceeds UPLOAD_MAX_BYTES.
+    """
+    if not _upload_slots.acquire(blocking=False):
+        raise UploadQueueFull()
+
+    path = None
+    upload_id = None
+    try:
+        content_type = resolve_content_type(upload_file)
+        path, size = _spool(upload_file.file)
+        if size > UPLOAD_MAX_BYTES:
+            raise ValueError(f"File is larger than {UPLOAD_MAX_BYTES} bytes")
+        key = build_s3_key(upload_file.filename, content_type, folder)
+
+        upload = crud_upload.create_upload(
+            db,
+            key=key,
+            filename=upload_file.filename,
+            content_type=content_type,
+            max_size=size,
+            size=size,
+            status="queued",
+            user_id=user_id,
+        )
+        db.commit()
+        upload_id = upload.id
+
+        upload_executor.submit(_transfer, upload_id, path, key, content_type, size)
+        return upload
+    except Exception as e:
+        _upload_slots.release()
+        if path is not None:
+            os.remove(path)
+        if upload_id is not None:
+            # The row is already committed as queued; nothing will pick it up
+            try:
+                _set_status(upload_id, "failed", error=str(e))
+            except Exception:
+                logger.exception("Could not mark upload %s as failed", upload_id)
+        raise
+
+
+def recover_stale_uploads() -> Tuple[int, int]:
+    """
+    Startup sweep for transfers a previous process never finished: marks
+    queued/uploading rows older than UPLOAD_STALE_SECONDS as failed and
+    removes upload-* spool files of the same age. The age cut-off leaves
+    transfers of other live workers alone. Returns (rows, files) cleaned up.
+    """
+    cutoff = time.time() - UPLOAD_STALE_SECONDS
+    with SessionLocal() as db:
+        rows = crud_upload.fail_stale_uploads(
+            db,
+            created_before=datetime.now(timezone.utc) - timedelta(seconds=UPLOAD_STALE_SECONDS),
+            error="interrupted",
+        )
+        db.commit()
+
+    files = 0
+    for path in glob.glob(os.path.join(UPLOAD_SPOOL_DIR or tempfile.gettempdir(), "upload-*")):
+        try:
+            if os.path.getmtime(path) < cutoff:
+                os.remove(path)
+                files += 1
+        except OSError:
+            pass
+
+    if rows or files:
+        logger.warning("Marked %d stale uploads as failed, removed %d spool files", rows, files)
+    return rows, files
@@ -0,0 +1,26 @@
+import hashlib
+from fastapi import Request, Response
+
+
+def build_etag(request: Request, version: str) -> str:
+    """Weak ETag for a data version token and the request's path and query."""
+    digest = hashlib.sha1(f"{request.url.path}?{request.url.query}:{version}".encode()).hexdigest()[:20]
+    return f'W/"{digest}"'
+
+
+def etag_matches(request: Request, etag: str) -> bool:
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    return header.strip() == "*" or etag in (tag.strip() for tag in header.split(","))
+
+
+def with_etag(response: Response, etag: str) -> Response:
+    # no-cache: clients may store the body but must revalidate every poll
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = "no-cache"
+    return response
+
+
+def not_modified(etag: str) -> Response:
+    return with_etag(Response(status_code=304), etag)
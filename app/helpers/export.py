@@ -0,0 +1,43 @@
+import csv
+import io
+import json
+from typing import Iterator, List
+from sqlalchemy.sql import Select
+from app.db.session import SessionLocal
+
+EXPORT_BATCH_SIZE = 1000
+
+EXPORT_MEDIA_TYPES = {
+    "ndjson": "application/x-ndjson",
+    "csv": "text/csv",
+}
+
+
+def stream_export(stmt: Select, columns: List[str], fmt: str = "ndjson") -> Iterator[str]:
+    """
+    Stream the rows of `stmt` as NDJSON or CSV using a server-side cursor.
+
+    The generator owns its own session because FastAPI closes the request
+    session before a StreamingResponse body is consumed. Output is flushed
+    once per fetched batch, so memory stays bounded by EXPORT_BATCH_SIZE.
+    """
+    with SessionLocal() as db:
+        result = db.execute(stmt.execution_options(yield_per=EXPORT_BATCH_SIZE))
+
+        if fmt == "csv":
+            buffer = io.StringIO()
+            writer = csv.writer(buffer)
+            writer.writerow(columns)
+            for partition in result.partitions():
+                writer.writerows(partition)
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate(0)
+            if buffer.tell():
+                yield buffer.getvalue()
+        else:
+            for partition in result.partitions():
+                yield "".join(
+                    json.dumps(dict(zip(columns, row)), default=str) + "\n"
+                    for row in partition
+                )
@@ -0,0 +1,218 @@
+import bisect
+import threading
+from contextvars import ContextVar
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+
+# Prometheus client defaults, in seconds
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+LabelValues = Tuple[str, ...]
+
+
+class _Sharded:
+    """
+    Per-thread storage for one metric: each thread only ever writes its own
+    dict, so recording needs no lock; a scrape sums the shards. The shard
+    list only grows when a new thread records for the first time.
+    """
+
+    def __init__(self):
+        self._local = threading.local()
+        self._shards: List[dict] = []
+
+    def _shard(self) -> dict:
+        shard = getattr(self._local, "shard", None)
+        if shard is None:
+            shard = self._local.shard = {}
+            self._shards.append(shard)
+        return shard
+
+    def _snapshots(self) -> List[dict]:
+        # dict() copies in one step under the GIL, so writers never break iteration
+        return [dict(shard) for shard in list(self._shards)]
+
+
+class Counter(_Sharded):
+    kind = "counter"
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        super().__init__()
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+
+    def inc(self, labels: LabelValues = (), amount: float = 1) -> None:
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0) + amount
+
+    def collect(self) -> Dict[LabelValues, float]:
+        totals: Dict[LabelValues, float] = {}
+        for shard in self._snapshots():
+            for labels, value in shard.items():
+                totals[labels] = totals.get(labels, 0) + value
+        return totals
+
+    def expose(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.collect().items())
+        ]
+
+
+class Gauge(Counter):
+    """Up/down gauge; the value is the sum of every thread's increments."""
+
+    kind = "gauge"
+
+    def dec(self, labels: LabelValues = (), amount: float = 1) -> None:
+        self.inc(labels, -amount)
+
+
+class Histogram(_Sharded):
+    kind = "histogram"
+
+    def __init__(
+        self,
+        name: str,
+        documentation: str,
+        labelnames: Iterable[str] = (),
+        buckets: Iterable[float] = DEFAULT_BUCKETS,
+    ):
+        super().__init__()
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, labels: LabelValues, value: float) -> None:
+        shard = self._shard()
+        # [count per bucket..., count above the last bucket, sum]
+        series = shard.get(labels)
+        if series is None:
+            series = shard[labels] = [0] * (len(self.buckets) + 2)
+        series[bisect.bisect_left(self.buckets, value)] += 1
+        series[-1] += value
+
+    def collect(self) -> Dict[LabelValues, list]:
+        totals: Dict[LabelValues, list] = {}
+        for shard in self._snapshots():
+            for labels, series in shard.items():
+                total = totals.setdefault(labels, [0] * len(series))
+                for index, value in enumerate(list(series)):
+                    total[index] += value
+        return totals
+
+    def expose(self) -> List[str]:
+        lines = []
+        for labels, series in sorted(self.collect().items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (float("inf"),), series[:-1]):
+                cumulative += count
+                le = "+Inf" if bound == float("inf") else _format_value(bound)
+                lines.append(
+                    f"{self.name}_bucket{_format_labels(self.labelnames + ('le',), labels + (le,))} {cumulative}"
+                )
+            label_text = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_text} {_format_value(series[-1])}")
+            lines.append(f"{self.name}_count{label_text} {cumulative}")
+        return lines
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: LabelValues) -> str:
+    if not names:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in zip(names, values)) + "}"
+
+
+def _format_value(value: float) -> str:
+    if isinstance(value, float) and value.is_integer() and abs(value) < 1e15:
+        return str(int(value))
+    return repr(value) if isinstance(value, float) else str(value)
+
+
+class Registry:
+    """Metrics recorded in-process plus collectors evaluated at scrape time."""
+
+    def __init__(self):
+        self._metrics: List = []
+        self._collectors: List[Callable] = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def register_collector(self, collector: Callable) -> None:
+        """
+        `collector()` yields (name, kind, documentation, labelnames, {labels: value})
+        for values read on demand, e.g. pool or cache stats.
+        """
+        self._collectors.append(collector)
+
+    def expose(self) -> str:
+        lines = []
+        for metric in self._metrics:
+            lines.append(f"# HELP {metric.name} {metric.documentation}")
+            lines.append(f"# TYPE {metric.name} {metric.kind}")
+            lines.extend(metric.expose())
+        for collector in self._collectors:
+            for name, kind, documentation, labelnames, values in collector():
+                lines.append(f"# HELP {name} {documentation}")
+                lines.append(f"# TYPE {name} {kind}")
+                lines.extend(
+                    f"{name}{_format_labels(labelnames, labels)} {_format_value(value)}"
+                    for labels, value in sorted(values.items())
+                )
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+http_requests_in_flight = registry.register(Gauge(
+    "http_requests_in_flight", "Requests currently being served.", ["method"]
+))
+http_requests_total = registry.register(Counter(
+    "http_requests_total", "Requests served, by route template and status code.", ["method", "route", "status"]
+))
+http_request_duration_seconds = registry.register(Histogram(
+    "http_request_duration_seconds", "Request duration, by route template.", ["method", "route"]
+))
+http_responses_total = registry.register(Counter(
+    "http_responses_total", "Responses by ResponseHandler outcome.", ["route", "outcome"]
+))
+
+
+class RequestMetrics:
+    """Per-request scratch space; ResponseHandler records its outcome here."""
+
+    __slots__ = ("outcome",)
+
+    def __init__(self):
+        self.outcome: Optional[str] = None
+
+
+current_request_metrics: ContextVar[Optional[RequestMetrics]] = ContextVar("current_request_metrics", default=None)
+
+
+def record_outcome(outcome: str) -> None:
+    # The holder is shared by reference, so this also works from the
+    # threadpool that sync endpoints run in (they get a copied context)
+    request_metrics = current_request_metrics.get()
+    if request_metrics is not None:
+        request_metrics.outcome = outcome
+
+
+def outcome_for_status(status: int) -> str:
+    """Fallback for responses not built by ResponseHandler (e.g. 422, 304)."""
+    if status < 400:
+        return "success"
+    if status in (401, 403):
+        return "unauthorized"
+    if status == 404:
+        return "not_found"
+    if status < 500:
+        return "bad_request"
+    return "internal_error"
@@ -1,8 +1,9 @@
-from fastapi.responses import JSONResponse
-from typing import Any, Dict
-from pydantic import BaseModel
+from fastapi.responses import JSONResponse, Response
+from typing import Any, Dict, Iterable
+from pydantic import BaseModel, TypeAdapter
 from sqlalchemy.orm import DeclarativeMeta
 import json
+from app.helpers.metrics import record_outcome
 def safe_serialize(obj: Any) -> Any:
     if isinstance(obj, BaseModel):
         return obj.model_dump()
@@ -15,22 +16,50 @@ def safe_serialize(obj: Any) -> Any:
             return json.loads(json.dumps(obj, default=str))  # fallback
         except Exception:
             return str(obj)  # final fallback
+def dump_json(adapter: TypeAdapter, rows: Iterable[Any]) -> bytes:
+    """Serialize ORM rows to JSON bytes in one pass through a precompiled TypeAdapter."""
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+
 class ResponseHandler:
     @staticmethod
     def success(
         data: Any = None,
         message: str = "Success",
-        code: int = 200
+        code: int = 200,
+        meta: Dict[str, Any] = None,
     ) -> JSONResponse:
-        return JSONResponse(
-            status_code=code,
-            content={
-                "status": "success",
-                "code": code,
-                "message": message,
-                "data": safe_serialize(data),
-            },
-        )
+        record_outcome("success")
+        content = {
+            "status": "success",
+            "code": code,
+            "message": message,
+            "data": safe_serialize(data),
+        }
+        if meta is not None:
+            content["meta"] = meta
+        return JSONResponse(status_code=code, content=content)
+
+    @staticmethod
+    def success_json(
+        data: bytes,
+        message: str = "Success",
+        code: int = 200,
+        meta: Dict[str, Any] = None,
+    ) -> Response:
+        """
+        Same envelope as success(), but `data` is already-encoded JSON
+        (see dump_json) and is spliced in without being parsed again.
+        """
+        record_outcome("success")
+        body = b"".join((
+            b'{"status":"success","code":', str(code).encode(),
+            b',"message":', json.dumps(message).encode(),
+            b',"data":', data,
+            b',"meta":' + json.dumps(meta, default=str).encode() if meta is not None else b"",
+            b"}",
+        ))
+        return Response(content=body, status_code=code, media_type="application/json")
 
     @staticmethod
     def bad_request(
@@ -39,6 +68,7 @@ class ResponseHandler:
         data: Any = None,
         code: int = 400,
     ) -> JSONResponse:
+        record_outcome("bad_request")
         return JSONResponse(
             status_code=code,
             content={
@@ -57,6 +87,7 @@ class ResponseHandler:
         data: Any = None,
         code: int = 401,
     ) -> JSONResponse:
+        record_outcome("unauthorized")
         return JSONResponse(
             status_code=code,
             content={
@@ -75,6 +106,7 @@ class ResponseHandler:
         data: Any = None,
         code: int = 404,
     ) -> JSONResponse:
+        record_outcome("not_found")
         return JSONResponse(
             status_code=code,
             content={
@@ -93,6 +125,7 @@ class ResponseHandler:
         data: Any = None,
         code: int = 500,
     ) -> JSONResponse:
+        record_outcome("internal_error")
         return JSONResponse(
             status_code=code,
             content={
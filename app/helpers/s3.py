@@ -1,7 +1,8 @@
 from datetime import datetime, timezone
-import boto3
 import os
+import threading
 from dotenv import load_dotenv
+from typing import Dict, Optional
 from uuid import uuid4
 
 from fastapi import UploadFile
@@ -12,13 +13,35 @@ AWS_ACCESS_KEY = os.getenv("AWS_ACCESS_KEY_ID")
 AWS_SECRET_KEY = os.getenv("AWS_SECRET_ACCESS_KEY")
 AWS_BUCKET_NAME = os.getenv("AWS_S3_BUCKET_NAME")
 AWS_REGION = os.getenv("AWS_S3_REGION")
+# Optional S3-compatible endpoint, e.g. a local MinIO/moto server in development
+AWS_S3_ENDPOINT_URL = os.getenv("AWS_S3_ENDPOINT_URL") or None
 
-s3_client = boto3.client(
-    "s3",
-    aws_access_key_id=AWS_ACCESS_KEY,
-    aws_secret_access_key=AWS_SECRET_KEY,
-    region_name=AWS_REGION
-)
+UPLOAD_URL_EXPIRES_SECONDS = int(os.getenv("UPLOAD_URL_EXPIRES_SECONDS", 900))
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", 25 * 1024 * 1024))
+
+_s3_client = None
+_s3_client_lock = threading.Lock()
+
+def get_s3_client():
+    """
+    Process-wide S3 client, built on first use. Importing boto3 and loading
+    its service model is the slowest part of app startup, and most requests
+    never touch S3. The client itself is thread-safe once created.
+    """
+    global _s3_client
+    if _s3_client is None:
+        with _s3_client_lock:
+            if _s3_client is None:
+                import boto3
+
+                _s3_client = boto3.client(
+                    "s3",
+                    aws_access_key_id=AWS_ACCESS_KEY,
+                    aws_secret_access_key=AWS_SECRET_KEY,
+                    region_name=AWS_REGION,
+                    endpoint_url=AWS_S3_ENDPOINT_URL
+                )
+    return _s3_client
 
 def determine_file_category(content_type: str) -> str:
     if content_type.startswith("image/"):
@@ -34,22 +57,89 @@ def determine_file_category(content_type: str) -> str:
     else:
         return "others"
 
-def upload_file_to_s3(upload_file: UploadFile, folder: str = None):
+def build_s3_key(filename: str, content_type: str, folder: str = None) -> str:
+    file_category = folder or determine_file_category(content_type)
+
+    extension = os.path.splitext(filename or "")[1] or ""
+    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S%f")
+    # Presigned keys are handed out before anything is written, so add a
+    # random suffix rather than rely on the timestamp alone being unique
+    generated_filename = f"{timestamp}-{uuid4().hex[:8]}{extension}"
+
+    return f"{file_category}/{generated_filename}"
+
+def s3_object_url(key: str) -> str:
+    if AWS_S3_ENDPOINT_URL:
+        return f"{AWS_S3_ENDPOINT_URL.rstrip('/')}/{AWS_BUCKET_NAME}/{key}"
+    return f"https://{AWS_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{key}"
+
+def generate_presigned_upload(key: str, content_type: str, max_size: int, method: str = "post") -> Dict:
+    """
+    Sign a direct-to-bucket upload of one object; no bytes pass through the API.
+
+    "post" returns a form policy that S3 itself enforces (exact Content-Type,
+    size within 1..max_size). "put" returns a plain URL for clients that cannot
+    send multipart forms; its size is only checked when the upload is confirmed.
+    """
+    if method == "put":
+        url = get_s3_client().generate_presigned_url(
+            "put_object",
+            Params={"Bucket": AWS_BUCKET_NAME, "Key": key, "ContentType": content_type},
+            ExpiresIn=UPLOAD_URL_EXPIRES_SECONDS,
+        )
+        return {
+            "method": "PUT",
+            "url": url,
+            "headers": {"Content-Type": content_type},
+            "expires_in": UPLOAD_URL_EXPIRES_SECONDS,
+        }
+
+    post = get_s3_client().generate_presigned_post(
+        Bucket=AWS_BUCKET_NAME,
+        Key=key,
+        Fields={"Content-Type": content_type},
+        Conditions=[
+            {"Content-Type": content_type},
+            ["content-length-range", 1, max_size],
+        ],
+        ExpiresIn=UPLOAD_URL_EXPIRES_SECONDS,
+    )
+    return {
+        "method": "POST",
+        "url": post["url"],
+        "fields": post["fields"],
+        "expires_in": UPLOAD_URL_EXPIRES_SECONDS,
+    }
+
+def head_s3_object(key: str) -> Optional[Dict]:
+    """Size and content type of a stored object, or None if it does not exist."""
+    from botocore.exceptions import ClientError
+
+    try:
+        head = get_s3_client().head_object(Bucket=AWS_BUCKET_NAME, Key=key)
+    except ClientError as e:
+        if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey", "NotFound"):
+            return None
+        raise
+    return {"size": head["ContentLength"], "content_type": head.get("ContentType")}
+
+def delete_s3_object(key: str) -> None:
+    get_s3_client().delete_object(Bucket=AWS_BUCKET_NAME, Key=key)
+
+def resolve_content_type(upload_file: UploadFile) -> str:
     import mimetypes
 
     content_type = upload_file.content_type
     if not content_type:
         content_type = mimetypes.guess_type(upload_file.filename)[0] or "application/octet-stream"
+    return content_type
 
-    file_category = folder or determine_file_category(content_type)
-
-    extension = os.path.splitext(upload_file.filename)[1] or ""
-    timestamp = datetime.now(timezone.utc).strftime("%Y%m%d%H%M%S%f")
-    generated_filename = f"{timestamp}{extension}"
+def upload_file_to_s3(upload_file: UploadFile, folder: str = None):
+    content_type = resolve_content_type(upload_file)
 
-    s3_key = f"{file_category}/{generated_filename}"
+    s3_key = build_s3_key(upload_file.filename, content_type, folder)
 
-    s3_client.upload_fileobj(
+    get_s3_client().upload_fileobj(
         Fileobj=upload_file.file,
         Bucket=AWS_BUCKET_NAME,
         Key=s3_key,
@@ -58,6 +148,4 @@ def upload_file_to_s3(upload_file: UploadFile, folder: str = None):
         }
     )
 
-    return f"https://{AWS_BUCKET_NAME}.s3.{AWS_REGION}.amazonaws.com/{s3_key}"
-
-
+    return s3_object_url(s3_key)
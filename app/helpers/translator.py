@@ -1,36 +1,55 @@
 import json
+from functools import lru_cache
 from pathlib import Path
 import logging
 
+SUPPORTED_LANGS = ("en", "hi")
+
+
+@lru_cache(maxsize=None)
+def load_catalog(langs=SUPPORTED_LANGS):
+    """Parse the locale files once per process; shared by every Translator."""
+    translations = {}
+    base_path = Path(__file__).resolve().parent.parent / "locals"
+
+    for lang in langs:
+        file = base_path / f"{lang}.json"
+        try:
+            with open(file, "r", encoding="utf-8") as f:
+                content = f.read().strip()
+                if not content:
+                    logging.warning(f"Translation file '{file}' is empty.")
+                    continue
+                translations[lang] = json.loads(content)
+        except Exception as e:
+            logging.warning(f"Failed to load translation file '{file}': {e}")
+
+    return translations
+
 
 class Translator:
     def __init__(self, default_lang="en"):
         self.default_lang = default_lang
-        self.supported_langs = ["en", "hi"]
-        self.translations = self.load_translations()
+        self.supported_langs = list(SUPPORTED_LANGS)
+
+    @property
+    def translations(self):
+        # Loaded on the first lookup, not at import time
+        return load_catalog()
 
     def load_translations(self):
-        translations = {}
-        base_path = Path(__file__).resolve().parent.parent / "locals"
-
-        for lang in self.supported_langs:
-            file = base_path / f"{lang}.json"
-            try:
-                with open(file, "r", encoding="utf-8") as f:
-                    content = f.read().strip()
-                    if not content:
-                        logging.warning(f"Translation file '{file}' is empty.")
-                        continue
-                    translations[lang] = json.loads(content)
-            except Exception as e:
-                logging.warning(f"Failed to load translation file '{file}': {e}")
-
-        return translations
+        return load_catalog()
 
     def t(self, key: str, lang: str = None) -> str:
         lang = lang if lang in self.supported_langs else self.default_lang
+        translations = self.translations
         return (
-                self.translations.get(lang, {}).get(key)
-                or self.translations.get(self.default_lang, {}).get(key)
+                translations.get(lang, {}).get(key)
+                or translations.get(self.default_lang, {}).get(key)
                 or key
         )
+
+
+@lru_cache(maxsize=None)
+def get_translator() -> Translator:
+    return Translator()
@@ -1,19 +1,30 @@
+import asyncio
+import logging
+from contextlib import asynccontextmanager, suppress
 from fastapi import FastAPI
+from app.db.partitions import maintain_attendance_partitions
+from app.helpers.background_upload import recover_stale_uploads
 from app.helpers.response import ResponseHandler
-from app.helpers.translator import Translator
+from app.helpers.translator import get_translator
 from app.helpers.utils import get_lang_from_request
 from fastapi.middleware.cors import CORSMiddleware
-from app.api.admin.v1 import auth, hrms, user
+from app.middlewares.metrics import MetricsMiddleware
+from app.middlewares.query_stats import QueryStatsMiddleware
+from app.api import metrics
+from app.api.admin.v1 import auth, hrms, system, upload, user
 from fastapi.openapi.utils import get_openapi
 from fastapi.security import OAuth2PasswordBearer
 from fastapi import FastAPI, Request
 from fastapi.responses import JSONResponse
+from starlette.concurrency import run_in_threadpool
 from starlette.exceptions import HTTPException as StarletteHTTPException
 # Use dependency-based authentication, not middleware!
 # from app.middlewares.auth import AuthMiddleware  # REMOVE THIS LINE
 
+logger = logging.getLogger(__name__)
+
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/admin/v1/auth/login")
-translator = Translator()
+translator = get_translator()
 
 def custom_openapi():
     if app.openapi_schema:
@@ -37,7 +48,22 @@ def custom_openapi():
     app.openapi_schema = openapi_schema
     return app.openapi_schema
 
-app = FastAPI(title="Project API", version="1.0")
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    try:
+        await run_in_threadpool(recover_stale_uploads)
+    except Exception:
+        # A missing database should not keep the API from starting
+        logger.exception("Could not recover stale uploads")
+    # Also runs once right away, so containers started without the
+    # entrypoint (e.g. docker-compose) get their partitions too
+    partitions = asyncio.create_task(maintain_attendance_partitions())
+    yield
+    partitions.cancel()
+    with suppress(asyncio.CancelledError):
+        await partitions
+
+app = FastAPI(title="Project API", version="1.0", lifespan=lifespan)
 
 @app.exception_handler(StarletteHTTPException)
 async def custom_http_exception_handler(request: Request, exc: StarletteHTTPException):
@@ -56,7 +82,11 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-DB-Query-Count", "X-DB-Time-Ms", "X-DB-Repeated-Statements"],
 )
+app.add_middleware(QueryStatsMiddleware)
+# Outermost, so durations include the other middlewares
+app.add_middleware(MetricsMiddleware)
 
 app.openapi = custom_openapi
 
@@ -67,3 +97,6 @@ app.openapi = custom_openapi
 app.include_router(auth.router)
 app.include_router(user.router)
 app.include_router(hrms.router)
+app.include_router(system.router)
+app.include_router(upload.router)
+app.include_router(metrics.router)
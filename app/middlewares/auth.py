@@ -3,13 +3,14 @@
 from fastapi import Request
 from fastapi.responses import JSONResponse # type: ignore
 from starlette.middleware.base import BaseHTTPMiddleware # type: ignore
-from jose import jwt, JWTError
+from jose import JWTError
 from app.db.session import SessionLocal, get_db
 from app.crud.user import get_user_by_id
+from app.core.security import decode_access_token_cached
 from sqlalchemy.orm import Session
 
 from app.helpers.response import ResponseHandler
-from app.helpers.translator import Translator
+from app.helpers.translator import get_translator
 import os
 
 
@@ -24,7 +25,7 @@ EXCLUDE_PATHS = [
     "/redoc",               # ReDoc UI,
     "/api/admin/v1/auth",  # Auth APIs
 ]
-translator = Translator()
+translator = get_translator()
 
 class AuthMiddleware(BaseHTTPMiddleware):
     async def dispatch(self, request: Request, call_next):
@@ -52,7 +53,7 @@ class AuthMiddleware(BaseHTTPMiddleware):
         token = auth_header.split(" ")[1]
         try:
             # Decode JWT token
-            payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
+            payload = decode_access_token_cached(token)
             user_id = payload.get("sub")
             if not user_id:
                 return ResponseHandler.unauthorized(
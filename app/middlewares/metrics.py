@@ -0,0 +1,55 @@
+# app/middlewares/metrics.py
+
+import time
+from app.helpers.metrics import (
+    RequestMetrics,
+    current_request_metrics,
+    http_request_duration_seconds,
+    http_requests_in_flight,
+    http_requests_total,
+    http_responses_total,
+    outcome_for_status,
+)
+
+UNMATCHED_ROUTE = "<unmatched>"
+
+
+class MetricsMiddleware:
+    """
+    Pure ASGI middleware recording request count, duration and outcome per
+    route template (e.g. /api/admin/v1/hrms/attendance/{employee_id}), so
+    path parameters do not multiply the number of series.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        method = scope["method"]
+        request_metrics = RequestMetrics()
+        token = current_request_metrics.set(request_metrics)
+        status = 500
+
+        async def send_with_status(message):
+            nonlocal status
+            if message["type"] == "http.response.start":
+                status = message["status"]
+            await send(message)
+
+        http_requests_in_flight.inc((method,))
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.dec((method,))
+            current_request_metrics.reset(token)
+
+            # The router stores the matched route in the (shared) scope
+            route = getattr(scope.get("route"), "path", UNMATCHED_ROUTE)
+            http_request_duration_seconds.observe((method, route), elapsed)
+            http_requests_total.inc((method, route, str(status)))
+            http_responses_total.inc((route, request_metrics.outcome or outcome_for_status(status)))
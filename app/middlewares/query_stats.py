@@ -0,0 +1,48 @@
+# app/middlewares/query_stats.py
+
+import logging
+from app.db.config import db_settings
+from app.db.instrumentation import QueryStats, current_query_stats
+
+logger = logging.getLogger(__name__)
+
+
+class QueryStatsMiddleware:
+    """
+    Pure ASGI middleware that collects per-request SQL stats.
+
+    Logs requests whose statements repeat (N+1 patterns) and, when
+    SQL_DEBUG_HEADERS is on, reports the counts in response headers.
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        stats = QueryStats()
+        token = current_query_stats.set(stats)
+
+        async def send_with_headers(message):
+            if message["type"] == "http.response.start" and db_settings.SQL_DEBUG_HEADERS:
+                headers = list(message.get("headers", []))
+                headers.append((b"x-db-query-count", str(stats.count).encode()))
+                headers.append((b"x-db-time-ms", f"{stats.total_seconds * 1000:.1f}".encode()))
+                headers.append((
+                    b"x-db-repeated-statements",
+                    str(len(stats.repeated(db_settings.SQL_REPEAT_THRESHOLD))).encode(),
+                ))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_headers)
+        finally:
+            current_query_stats.reset(token)
+            for statement, times in stats.repeated(db_settings.SQL_REPEAT_THRESHOLD):
+                logger.warning(
+                    "Possible N+1 on %s %s: statement ran %d times: %s",
+                    scope["method"], scope["path"], times, statement,
+                )
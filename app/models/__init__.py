@@ -1,4 +1,7 @@
 # app/models/__init__.py
 from .user import *
 from .user_otp import *
-from .employee import *
\ No newline at end of file
+from .employee import *
+from .dashboard import *
+from .data_version import *
+from .upload import *
\ No newline at end of file
@@ -0,0 +1,35 @@
+from sqlalchemy import Column, Date, ForeignKey, Index, Integer, String
+from app.db.base import Base
+
+
+# Rollup tables below are maintained by database triggers on employees and
+# attendance (see alembic revisions f40d912d1004 and dd6ede3b6eea); never write
+# to them directly. `python -m app.commands.rebuild_rollups` recomputes them.
+
+class DepartmentHeadcount(Base):
+    __tablename__ = "department_headcount"
+
+    department = Column(String(100), primary_key=True)
+    employee_count = Column(Integer, nullable=False, default=0)
+
+
+class AttendanceDailySummary(Base):
+    __tablename__ = "attendance_daily_summary"
+
+    date = Column(Date, primary_key=True)
+    department = Column(String(100), primary_key=True)
+    present_count = Column(Integer, nullable=False, default=0)
+    absent_count = Column(Integer, nullable=False, default=0)
+
+
+class AttendanceMonthly(Base):
+    __tablename__ = "attendance_monthly"
+
+    __table_args__ = (
+        Index("ix_attendance_monthly_month", "month", "employee_id"),
+    )
+
+    employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"), primary_key=True)
+    month = Column(Date, primary_key=True)  # first day of the month
+    present_days = Column(Integer, nullable=False, default=0)
+    absent_days = Column(Integer, nullable=False, default=0)
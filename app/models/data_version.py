@@ -0,0 +1,14 @@
+from sqlalchemy import BigInteger, Column, String
+from app.db.base import Base
+
+
+class DataVersion(Base):
+    """
+    Change counter per cache scope ("employees", "attendance:<employee_id>").
+    Bumped by triggers on every write (alembic revision 6a785b827633); the
+    employees scope is spread over "employees#<n>" rows (4af81efe883e).
+    """
+    __tablename__ = "data_versions"
+
+    scope = Column(String(64), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=1)
@@ -1,7 +1,7 @@
 import enum
 
-from sqlalchemy import Column, Date, Integer, String, Boolean, ForeignKey, DateTime, UniqueConstraint
-from sqlalchemy.sql import func
+from sqlalchemy import Column, Date, Integer, String, Boolean, ForeignKey, DateTime, UniqueConstraint, Index
+from sqlalchemy.sql import func, text
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.dialects.postgresql import JSONB
 import uuid
@@ -12,8 +12,15 @@ from datetime import datetime, timezone
 class Employee(Base):
     __tablename__ = "employees"
 
+    __table_args__ = (
+        Index("ix_employees_department_id", "department", "id"),
+    )
+    # Fetch id and employee_code via INSERT ... RETURNING instead of a refresh
+    __mapper_args__ = {"eager_defaults": True}
+
     id = Column(Integer, primary_key=True, index=True)
-    employee_code = Column(String(50), unique=True, nullable=False)
+    # Allocated by the employee_code_seq sequence (see next_employee_code())
+    employee_code = Column(String(50), unique=True, nullable=False, server_default=text("next_employee_code()"))
     full_name = Column(String(150), nullable=False)
     email = Column(String(150), unique=True, nullable=False)
     department = Column(String(100), nullable=False)
@@ -21,7 +28,8 @@ class Employee(Base):
     attendance_records = relationship(
         "Attendance",
         back_populates="employee",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True
     )
 
 class AttendanceStatusEnum(str, enum.Enum):
@@ -32,13 +40,17 @@ class AttendanceStatusEnum(str, enum.Enum):
 class Attendance(Base):
     __tablename__ = "attendance"
 
+    # Range-partitioned by month on date (alembic revision 0e3540c43c07);
+    # partitions are managed by app.db.partitions.
     __table_args__ = (
         UniqueConstraint("employee_id", "date", name="unique_employee_date"),
+        {"postgresql_partition_by": "RANGE (date)"},
     )
 
-    id = Column(Integer, primary_key=True)
+    # The partition key must be part of the primary key
+    id = Column(Integer, primary_key=True, autoincrement=True)
     employee_id = Column(Integer, ForeignKey("employees.id", ondelete="CASCADE"))
-    date = Column(Date, nullable=False)
+    date = Column(Date, primary_key=True, nullable=False)
     status = Column(String(20), nullable=False)
 
     employee = relationship("Employee", back_populates="attendance_records")
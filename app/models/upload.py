@@ -0,0 +1,22 @@
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String, Text
+from datetime import datetime, timezone
+from app.db.base import Base
+
+
+class FileUpload(Base):
+    __tablename__ = "file_uploads"
+
+    id = Column(Integer, primary_key=True, index=True)
+    key = Column(String(512), unique=True, nullable=False)
+    filename = Column(String(255), nullable=True)
+    content_type = Column(String(255), nullable=False)
+    max_size = Column(BigInteger, nullable=False)
+    size = Column(BigInteger, nullable=True)
+    # pending (presigned, awaiting confirm) | queued | uploading (server-side
+    # transfer) | uploaded | failed
+    status = Column(String(20), nullable=False, default="pending")
+    bytes_transferred = Column(BigInteger, nullable=False, default=0, server_default="0")
+    error = Column(Text, nullable=True)
+    uploaded_by = Column(Integer, ForeignKey("users.id"), nullable=True)
+    created_at = Column(DateTime(timezone=True), default=lambda: datetime.now(timezone.utc))
+    confirmed_at = Column(DateTime(timezone=True), nullable=True)
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime
+from sqlalchemy import Column, Integer, String, Boolean, ForeignKey, DateTime, Index, text
 from sqlalchemy.sql import func
 from sqlalchemy.dialects.postgresql import UUID
 from sqlalchemy.dialects.postgresql import JSONB
@@ -11,6 +11,12 @@ from datetime import datetime, timezone
 class User(Base):
     __tablename__ = "users"
 
+    # Login looks users up by username or phone number among non-deleted rows
+    __table_args__ = (
+        Index("ix_users_username_active", "username", postgresql_where=text("is_deleted = false")),
+        Index("ix_users_phone_number_active", "phone_number", postgresql_where=text("is_deleted = false")),
+    )
+
     id = Column(Integer, primary_key=True, index=True)
     first_name = Column(String, nullable=False)
     last_name = Column(String, nullable=False)
@@ -1,5 +1,6 @@
-from pydantic import BaseModel, EmailStr
+from pydantic import BaseModel, EmailStr, Field, TypeAdapter
 from datetime import date
+from typing import List, Optional
 from enum import Enum
 
 
@@ -31,6 +32,19 @@ class AttendanceCreate(BaseModel):
     status: AttendanceStatus
 
 
+class AttendanceBulkCreate(BaseModel):
+    records: List[AttendanceCreate] = Field(..., min_length=1, max_length=5000)
+
+
+class AttendanceRosterCreate(BaseModel):
+    date: date
+    status: AttendanceStatus = AttendanceStatus.PRESENT
+    department: Optional[str] = None
+    exclude_ids: List[int] = []
+    excluded_status: Optional[AttendanceStatus] = None
+    overwrite: bool = False
+
+
 class AttendanceResponse(BaseModel):
     id: int
     employee_id: int
@@ -39,3 +53,8 @@ class AttendanceResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+
+# Built once at import; validate ORM rows by attribute and dump straight to JSON bytes
+EmployeeListAdapter = TypeAdapter(List[EmployeeResponse])
+AttendanceListAdapter = TypeAdapter(List[AttendanceResponse])
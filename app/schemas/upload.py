@@ -0,0 +1,10 @@
+from pydantic import BaseModel, Field
+from typing import Literal, Optional
+
+
+class UploadPresignRequest(BaseModel):
+    filename: str = Field(..., min_length=1, max_length=255)
+    content_type: str = Field(..., pattern=r"^[\w.+-]+/[\w.+-]+$", max_length=255)
+    size: int = Field(..., gt=0, description="Size of the file in bytes")
+    folder: Optional[str] = Field(None, pattern=r"^[\w-]+$", max_length=50)
+    method: Literal["post", "put"] = "post"
@@ -0,0 +1,303 @@
+"""
+Latency and throughput of the HRMS read endpoints, driven in-process.
+
+Requests go through httpx's ASGITransport straight into app.main.app, so the
+numbers cover routing, auth, handlers, serialization and PostgreSQL, but no
+network or server process. Needs a migrated, disposable database:
+
+    DATABASE_URL=postgresql://.../hrms_bench alembic upgrade head
+    DATABASE_URL=postgresql://.../hrms_bench python -m benchmarks.bench_api --seed
+
+--seed (re)creates the dataset: it TRUNCATEs employees/attendance, so it
+refuses to run unless the database name contains "bench" (or --force).
+Without --seed an existing dataset is reused.
+
+Per route it reports p50/p95/p99 latency and requests/second, and writes
+them to --output as JSON; pass an earlier file as --baseline to compare.
+
+Usage:
+    python -m benchmarks.bench_api [--seed] [--employees 10000] [--attendance 5000000]
+                                   [--requests 500] [--concurrency 8]
+                                   [--routes employees_first_page dashboard_summary]
+                                   [--output bench_api.json] [--baseline previous.json]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import statistics
+import subprocess
+import sys
+import time
+from collections import Counter
+from datetime import date, timedelta
+from pathlib import Path
+
+DEPARTMENTS = 12
+PAGE_SIZE = 50
+
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database-url", default=os.getenv("DATABASE_URL"))
+    parser.add_argument("--seed", action="store_true", help="Recreate the synthetic dataset first")
+    parser.add_argument("--force", action="store_true", help="Allow --seed on a database not named *bench*")
+    parser.add_argument("--employees", type=int, default=10_000)
+    parser.add_argument("--attendance", type=int, default=5_000_000)
+    parser.add_argument("--requests", type=int, default=500, help="Measured requests per route (> 0)")
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per route")
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--routes", nargs="*", help="Only run these routes")
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--output", help="Write results as JSON to this file")
+    parser.add_argument("--baseline", help="JSON from a previous --output run to compare against")
+    args = parser.parse_args()
+    if not args.database_url:
+        parser.error("set DATABASE_URL or pass --database-url")
+    if args.requests < 1:
+        parser.error("--requests must be at least 1")
+    return args
+
+
+# --- dataset -----------------------------------------------------------------
+
+def seed_dataset(db, employees: int, attendance: int, seed: int) -> None:
+    """Reset employees/attendance and regenerate them with the COPY generator."""
+    from sqlalchemy import text
+    from app.commands.generate_data import DEFAULT_DEPARTMENTS, generate
+
+    days = max(1, attendance // employees)
+    date_to = date.today() - timedelta(days=1)
+
+    db.execute(text("TRUNCATE employees RESTART IDENTITY CASCADE"))
+    db.commit()
+    generate(
+        db,
+        employees=employees,
+        date_from=date_to - timedelta(days=days - 1),
+        date_to=date_to,
+        departments=DEFAULT_DEPARTMENTS[:DEPARTMENTS],
+        seed=seed,
+    )
+
+
+def dataset_info(db) -> dict:
+    from sqlalchemy import text
+
+    row = db.execute(text("""
+        SELECT (SELECT count(*) FROM employees), (SELECT count(*) FROM attendance),
+               (SELECT min(date) FROM attendance), (SELECT max(date) FROM attendance)
+    """)).one()
+    departments = list(db.execute(text("SELECT DISTINCT department FROM employees ORDER BY 1")).scalars())
+    return {
+        "employees": row[0], "attendance": row[1], "first_day": row[2], "last_day": row[3],
+        "departments": departments,
+    }
+
+
+def bench_token(db) -> str:
+    from app.core.security import create_access_token, get_password_hash
+    from app.models import User
+
+    user = db.query(User).filter(User.username == "bench_admin").first()
+    if user is None:
+        user = User(
+            first_name="Bench",
+            last_name="Admin",
+            phone_number="0000000000",
+            username="bench_admin",
+            password=get_password_hash("Bench@12345"),
+            role="ADMIN",
+            is_active=True,
+            is_deleted=False,
+        )
+        db.add(user)
+        db.commit()
+    return create_access_token(data={"sub": str(user.id)})
+
+
+# --- routes ------------------------------------------------------------------
+
+def build_routes(info: dict):
+    """name -> fn(rng) returning (path, headers) for one request."""
+    prefix = "/api/admin/v1/hrms"
+    employees = max(info["employees"], 1)
+    departments = info["departments"] or ["Engineering"]
+    last_day = info["last_day"] or date.today()
+    first_day = info["first_day"] or last_day
+
+    def employee_id(rng):
+        return rng.randint(1, employees)
+
+    def month(rng):
+        day = first_day + timedelta(days=rng.randint(0, max((last_day - first_day).days, 0)))
+        return day.strftime("%Y-%m")
+
+    def date_range(rng):
+        start = first_day + timedelta(days=rng.randint(0, max((last_day - first_day).days - 90, 0)))
+        return start, start + timedelta(days=90)
+
+    return {
+        "employees_first_page": lambda rng: (f"{prefix}/employees?limit={PAGE_SIZE}", {}),
+        "employees_deep_page": lambda rng: (
+            f"{prefix}/employees?limit={PAGE_SIZE}&after={employee_id(rng)}", {}),
+        "employees_by_department": lambda rng: (
+            f"{prefix}/employees?limit={PAGE_SIZE}&department={rng.choice(departments)}", {}),
+        "employees_not_modified": "etag",
+        "attendance_history": lambda rng: (f"{prefix}/attendance/{employee_id(rng)}?limit=100", {}),
+        "attendance_range": lambda rng: (
+            "{}/attendance/{}?from={}&to={}&limit=100".format(prefix, employee_id(rng), *date_range(rng)), {}),
+        "attendance_calendar": lambda rng: (
+            f"{prefix}/attendance/{employee_id(rng)}?month={month(rng)}", {}),
+        "attendance_monthly_employee": lambda rng: (
+            f"{prefix}/attendance/monthly?employee_id={employee_id(rng)}", {}),
+        "attendance_monthly_all": lambda rng: (
+            "{0}/attendance/monthly?from_month={1}&to_month={1}".format(prefix, month(rng)), {}),
+        "dashboard_summary": lambda rng: (f"{prefix}/dashboard/summary", {}),
+        "export_employees_csv": lambda rng: (f"{prefix}/export/employees?format=csv", {}),
+    }
+
+
+async def resolve_etag_route(client, prefix="/api/admin/v1/hrms"):
+    path = f"{prefix}/employees?limit={PAGE_SIZE}"
+    etag = (await client.get(path)).headers.get("etag")
+    headers = {"If-None-Match": etag} if etag else {}
+    return lambda rng: (path, headers)
+
+
+# --- measurement -------------------------------------------------------------
+
+def percentile(samples, pct):
+    ordered = sorted(samples)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * len(ordered)) - 1))
+    return ordered[index]
+
+
+async def measure(client, build, requests: int, concurrency: int, rng) -> dict:
+    latencies = []
+    statuses = Counter()
+    pending = iter(range(requests))
+
+    async def worker():
+        for _ in pending:
+            path, headers = build(rng)
+            started = time.perf_counter()
+            response = await client.get(path, headers=headers)
+            latencies.append(time.perf_counter() - started)
+            statuses[response.status_code] += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    wall = time.perf_counter() - started
+
+    return {
+        "requests": requests,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 2),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 2),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 2),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 2),
+        "rps": round(requests / wall, 1),
+        "status": {str(code): count for code, count in sorted(statuses.items())},
+    }
+
+
+async def run_routes(app, token: str, routes: dict, args) -> dict:
+    import httpx
+
+    rng = random.Random(args.random_seed)
+    transport = httpx.ASGITransport(app=app)
+    results = {}
+    async with httpx.AsyncClient(
+        transport=transport,
+        base_url="http://bench",
+        headers={"Authorization": f"Bearer {token}"},
+        timeout=None,
+    ) as client:
+        for name, build in routes.items():
+            if build == "etag":
+                build = await resolve_etag_route(client)
+            if args.warmup:
+                await measure(client, build, args.warmup, args.concurrency, rng)
+            results[name] = await measure(client, build, args.requests, args.concurrency, rng)
+            print_row(name, results[name])
+    return results
+
+
+# --- reporting ---------------------------------------------------------------
+
+def print_header() -> None:
+    print(f"{'route':<30}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'req/s':>9}  status")
+
+
+def print_row(name: str, result: dict) -> None:
+    statuses = ",".join(f"{code}x{count}" for code, count in result["status"].items())
+    print(f"{name:<30}{result['p50_ms']:>9.1f}{result['p95_ms']:>9.1f}"
+          f"{result['p99_ms']:>9.1f}{result['rps']:>9.1f}  {statuses}")
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], cwd=Path(__file__).resolve().parent.parent,
+            capture_output=True, text=True, check=True,
+        ).stdout.strip()
+    except Exception:
+        return "unknown"
+
+
+def main():
+    args = parse_args()
+    # app.db.session builds its engines from DATABASE_URL at import
+    os.environ["DATABASE_URL"] = args.database_url
+
+    from sqlalchemy.engine import make_url
+    from app.db.session import SessionLocal
+    from app.main import app
+
+    with SessionLocal() as db:
+        if args.seed:
+            database = make_url(args.database_url).database or ""
+            if "bench" not in database and not args.force:
+                sys.exit(f"refusing to reseed database {database!r}; use a *bench* database or --force")
+            started = time.perf_counter()
+            seed_dataset(db, args.employees, args.attendance, args.random_seed)
+            print(f"seeded in {time.perf_counter() - started:.1f}s")
+        info = dataset_info(db)
+        token = bench_token(db)
+
+    print(f"dataset: {info['employees']} employees, {info['attendance']} attendance rows "
+          f"({info['first_day']} .. {info['last_day']})")
+
+    routes = build_routes(info)
+    if args.routes:
+        unknown = set(args.routes) - set(routes)
+        if unknown:
+            sys.exit(f"unknown routes: {', '.join(sorted(unknown))}")
+        routes = {name: build for name, build in routes.items() if name in args.routes}
+
+    baseline = json.loads(Path(args.baseline).read_text())["routes"] if args.baseline else {}
+    print_header()
+    results = asyncio.run(run_routes(app, token, routes, args))
+
+    if baseline:
+        print("\nchange vs baseline (p95 / req/s):")
+        for name, result in results.items():
+            if name in baseline:
+                before = baseline[name]
+                print(f"  {name:<28}{(result['p95_ms'] / before['p95_ms'] - 1) * 100:>+8.1f}%"
+                      f"{(result['rps'] / before['rps'] - 1) * 100:>+8.1f}%")
+
+    if args.output:
+        Path(args.output).write_text(json.dumps({
+            "revision": git_revision(),
+            "python": sys.version.split()[0],
+            "dataset": {**info, "first_day": str(info["first_day"]), "last_day": str(info["last_day"])},
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "routes": results,
+        }, indent=2) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Login password-verification throughput under concurrency.
+
+Compares the old path (bcrypt verified twice on the request threadpool, as
+Starlette's default 40-thread limiter would run it) with the dedicated,
+bounded hashing executor used by login_user. Also reports how late a 10 ms
+event-loop heartbeat fires while the burst is running, a proxy for how much
+other API traffic stalls. Needs no database.
+
+Usage:
+    python -m benchmarks.bench_login [--concurrency 1 8 32 128] [--requests 64]
+"""
+import argparse
+import asyncio
+import statistics
+import time
+from anyio import to_thread
+from app.core.security import (
+    PASSWORD_HASH_MAX_PENDING,
+    PASSWORD_HASH_WORKERS,
+    PasswordHashingBusy,
+    get_password_hash,
+    pwd_context,
+    verify_and_update_password,
+)
+
+PASSWORD = "Bench@12345"
+
+
+def old_verify(hashed):
+    # Mirrors the previous verify_username_password: print(verify) + return verify
+    pwd_context.verify(PASSWORD, hashed)
+    return pwd_context.verify(PASSWORD, hashed)
+
+
+async def heartbeat(stop: asyncio.Event, lags: list):
+    while not stop.is_set():
+        started = time.perf_counter()
+        await asyncio.sleep(0.01)
+        lags.append(time.perf_counter() - started - 0.01)
+
+
+async def run(mode: str, hashed: str, concurrency: int, total: int):
+    semaphore = asyncio.Semaphore(concurrency)
+    rejected = 0
+
+    async def one():
+        nonlocal rejected
+        async with semaphore:
+            if mode == "old":
+                await to_thread.run_sync(old_verify, hashed)
+            else:
+                try:
+                    await verify_and_update_password(PASSWORD, hashed)
+                except PasswordHashingBusy:
+                    rejected += 1
+
+    stop, lags = asyncio.Event(), []
+    probe = asyncio.create_task(heartbeat(stop, lags))
+    started = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    elapsed = time.perf_counter() - started
+    stop.set()
+    await probe
+
+    lag_ms = statistics.quantiles(lags, n=100)[98] * 1000 if len(lags) > 1 else 0.0
+    return (total - rejected) / elapsed, rejected, lag_ms
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 8, 32, 128])
+    parser.add_argument("--requests", type=int, default=64)
+    args = parser.parse_args()
+
+    hashed = get_password_hash(PASSWORD)
+    print(f"hash workers={PASSWORD_HASH_WORKERS} max pending={PASSWORD_HASH_MAX_PENDING}")
+    print(f"{'mode':<10}{'conc':>6}{'logins/s':>10}{'rejected':>10}{'loop p99 lag ms':>17}")
+    for concurrency in args.concurrency:
+        for mode in ("old", "executor"):
+            throughput, rejected, lag_ms = asyncio.run(run(mode, hashed, concurrency, args.requests))
+            print(f"{mode:<10}{concurrency:>6}{throughput:>10.1f}{rejected:>10}{lag_ms:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
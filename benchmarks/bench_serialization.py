@@ -0,0 +1,81 @@
+"""
+Cost of serializing list responses: the old jsonable_encoder -> safe_serialize
+-> JSONResponse path versus the precompiled TypeAdapter fast path.
+
+Runs without a database (rows are transient ORM objects).
+
+Usage:
+    python -m benchmarks.bench_serialization [--rows 10000] [--repeat 5]
+"""
+import argparse
+import statistics
+import time
+from datetime import date, timedelta
+from fastapi.encoders import jsonable_encoder
+from app.helpers.response import ResponseHandler, dump_json
+from app.models.employee import Attendance, Employee
+from app.schemas.employee import AttendanceListAdapter, EmployeeListAdapter
+
+
+def make_employees(n):
+    return [
+        Employee(
+            id=i,
+            employee_code=f"EMP{i:03d}",
+            full_name=f"Employee {i}",
+            email=f"employee{i}@example.com",
+            department=f"Department {i % 12}",
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def make_attendance(n):
+    start = date(2020, 1, 1)
+    return [
+        Attendance(
+            id=i,
+            employee_id=1,
+            date=start + timedelta(days=i),
+            status="PRESENT" if i % 7 else "ABSENT",
+        )
+        for i in range(1, n + 1)
+    ]
+
+
+def old_path(rows):
+    return ResponseHandler.success(data=jsonable_encoder(rows)).body
+
+
+def fast_path(adapter, rows):
+    return ResponseHandler.success_json(data=dump_json(adapter, rows)).body
+
+
+def timed(fn, repeat):
+    samples = []
+    for _ in range(repeat):
+        started = time.perf_counter()
+        fn()
+        samples.append(time.perf_counter() - started)
+    return statistics.median(samples)
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    cases = [
+        ("employees", make_employees(args.rows), EmployeeListAdapter),
+        ("attendance", make_attendance(args.rows), AttendanceListAdapter),
+    ]
+    print(f"{'payload':<12}{'rows':>8}{'old ms':>10}{'fast ms':>10}{'speedup':>9}")
+    for name, rows, adapter in cases:
+        old = timed(lambda: old_path(rows), args.repeat)
+        fast = timed(lambda: fast_path(adapter, rows), args.repeat)
+        print(f"{name:<12}{len(rows):>8}{old * 1000:>10.1f}{fast * 1000:>10.1f}{old / fast:>8.1f}x")
+
+
+if __name__ == "__main__":
+    main()
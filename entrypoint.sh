@@ -3,5 +3,8 @@
 echo "Running Alembic migrations..."
 alembic upgrade head
 
+echo "Ensuring upcoming attendance partitions..."
+python -m app.commands.attendance_partitions ensure
+
 echo "Starting FastAPI..."
 exec uvicorn app.main:app --host 0.0.0.0 --port ${PORT:-8000}
@@ -0,0 +1,76 @@
+"""
+Query-plan test for the login lookup (crud.user.user_by_identifier_stmt).
+
+Needs a PostgreSQL database migrated to head, given as TEST_DATABASE_URL;
+skipped otherwise. Users are seeded inside a transaction that is rolled
+back, so the database is left as it was.
+"""
+import json
+import os
+import pytest
+from sqlalchemy import create_engine, text
+from sqlalchemy.dialects import postgresql
+from app.crud.user import user_by_identifier_stmt
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+pytestmark = pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL is not set")
+
+SEEDED_USERS = 20_000
+
+
+@pytest.fixture(scope="module")
+def db():
+    engine = create_engine(TEST_DATABASE_URL)
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        # Enough rows (a fifth of them soft-deleted) for the planner to pick
+        # indexes on its own; no enable_seqscan tweaks
+        connection.execute(text("""
+            INSERT INTO users (first_name, last_name, phone_number, username, password, role,
+                               is_active, is_deleted)
+            SELECT 'Plan', 'User ' || n, '7' || lpad(n::text, 9, '0'), 'plan_user_' || n, 'x', 'ADMIN',
+                   true, n % 5 = 0
+            FROM generate_series(1, :count) AS n
+        """), {"count": SEEDED_USERS})
+        connection.execute(text("ANALYZE users"))
+        yield connection
+        transaction.rollback()
+    engine.dispose()
+
+
+def plan_nodes(node):
+    yield node
+    for child in node.get("Plans", []):
+        yield from plan_nodes(child)
+
+
+def users_scans(db, identifier: str):
+    compiled = user_by_identifier_stmt(identifier).compile(
+        dialect=postgresql.dialect(), compile_kwargs={"literal_binds": True}
+    )
+    row = db.execute(text(f"EXPLAIN (FORMAT JSON) {compiled}")).scalar()
+    plan = (row if isinstance(row, list) else json.loads(row))[0]["Plan"]
+    return [node for node in plan_nodes(plan) if node.get("Relation Name") == "users"]
+
+
+def assert_probe(scan, index_name: str, column: str):
+    assert scan["Node Type"] in ("Index Scan", "Index Only Scan", "Bitmap Heap Scan"), scan["Node Type"]
+    if scan["Node Type"] == "Bitmap Heap Scan":
+        scan = next(node for node in plan_nodes(scan) if node["Node Type"] == "Bitmap Index Scan")
+    assert scan["Index Name"] == index_name
+    assert column in scan["Index Cond"]
+
+
+@pytest.mark.parametrize("identifier", ["plan_user_42", "7000000042"])
+def test_login_lookup_never_seq_scans_users(db, identifier):
+    scans = users_scans(db, identifier)
+    assert scans
+    assert all(scan["Node Type"] != "Seq Scan" for scan in scans)
+
+
+def test_login_lookup_probes_each_partial_index(db):
+    # UNION ALL: username probe first, then phone number
+    username_scan, phone_scan = users_scans(db, "plan_user_42")
+    assert_probe(username_scan, "ix_users_username_active", "username")
+    assert_probe(phone_scan, "ix_users_phone_number_active", "phone_number")
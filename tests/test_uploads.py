@@ -0,0 +1,317 @@
+"""
+Upload endpoints (presign/confirm and the 202 proxy upload) against moto's
+in-process S3 stand-in.
+
+The router is mounted on a bare FastAPI app with the user and DB session
+dependencies overridden; file_uploads lives in an in-memory SQLite database.
+"""
+import base64
+import json
+import os
+import threading
+from datetime import datetime, timedelta, timezone
+import boto3
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from moto import mock_aws
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from app.api.admin.v1 import upload as upload_api
+from app.core.dependencies import get_current_user
+from app.db.session import get_db
+from app.helpers import background_upload, s3
+from app.models import User
+from app.models.upload import FileUpload
+
+CONTENT_TYPE = "application/pdf"
+DECLARED_SIZE = 1024
+
+
+@pytest.fixture
+def bucket(monkeypatch):
+    with mock_aws():
+        monkeypatch.setattr(s3, "AWS_S3_ENDPOINT_URL", None)
+        # Rebuild the lazy client inside the mock
+        monkeypatch.setattr(s3, "_s3_client", None)
+        client = boto3.client("s3", region_name=s3.AWS_REGION)
+        client.create_bucket(Bucket=s3.AWS_BUCKET_NAME)
+        yield client
+
+
+@pytest.fixture
+def session_factory():
+    engine = create_engine(
+        "sqlite://", connect_args={"check_same_thread": False}, poolclass=StaticPool
+    )
+    User.__table__.create(engine)
+    FileUpload.__table__.create(engine)
+    factory = sessionmaker(bind=engine, autoflush=False)
+    with factory() as db:
+        db.add(User(
+            id=1, first_name="Test", last_name="Admin", phone_number="9999988888",
+            username="admin", password="x", role="ADMIN", is_deleted=False,
+        ))
+        db.commit()
+    yield factory
+    engine.dispose()
+
+
+@pytest.fixture
+def client(bucket, session_factory):
+    app = FastAPI()
+    app.include_router(upload_api.router)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_current_user] = lambda: User(id=1, username="admin", is_deleted=False)
+    with TestClient(app) as test_client:
+        yield test_client
+
+
+class ManualExecutor:
+    """Stands in for upload_executor; transfers run only when the test says so."""
+
+    def __init__(self):
+        self.submitted = []
+
+    def submit(self, fn, *args):
+        self.submitted.append((fn, args))
+
+    def run_all(self):
+        for fn, args in self.submitted:
+            fn(*args)
+
+
+@pytest.fixture
+def proxy(monkeypatch, tmp_path, session_factory):
+    executor = ManualExecutor()
+    monkeypatch.setattr(background_upload, "upload_executor", executor)
+    monkeypatch.setattr(background_upload, "_upload_slots", threading.BoundedSemaphore(2))
+    monkeypatch.setattr(background_upload, "UPLOAD_SPOOL_DIR", str(tmp_path))
+    monkeypatch.setattr(background_upload, "SessionLocal", session_factory)
+    return executor
+
+
+def presign(client, method="post", content_type=CONTENT_TYPE, size=DECLARED_SIZE):
+    response = client.post("/api/admin/v1/uploads/presign", json={
+        "filename": "contract.pdf",
+        "content_type": content_type,
+        "size": size,
+        "method": method,
+    })
+    assert response.status_code == 200, response.text
+    return response.json()["data"]
+
+
+def confirm(client, upload_id):
+    return client.post(f"/api/admin/v1/uploads/{upload_id}/confirm")
+
+
+def stored_upload(session_factory, upload_id) -> FileUpload:
+    with session_factory() as db:
+        return db.get(FileUpload, upload_id)
+
+
+def object_exists(bucket, key) -> bool:
+    return bucket.list_objects_v2(Bucket=s3.AWS_BUCKET_NAME, Prefix=key).get("KeyCount", 0) > 0
+
+
+def test_presign_post_returns_size_and_type_constrained_policy(client):
+    data = presign(client, method="post")
+
+    assert data["method"] == "POST"
+    assert data["fields"]["key"] == data["key"]
+    assert data["fields"]["Content-Type"] == CONTENT_TYPE
+    policy = json.loads(base64.b64decode(data["fields"]["policy"]))
+    assert ["content-length-range", 1, DECLARED_SIZE] in policy["conditions"]
+    assert {"Content-Type": CONTENT_TYPE} in policy["conditions"]
+
+
+def test_presign_put_returns_signed_url(client):
+    data = presign(client, method="put")
+
+    assert data["method"] == "PUT"
+    assert data["key"] in data["url"]
+    assert "Signature" in data["url"]
+    assert data["headers"] == {"Content-Type": CONTENT_TYPE}
+
+
+def test_presign_rejects_files_over_the_limit(client):
+    response = client.post("/api/admin/v1/uploads/presign", json={
+        "filename": "huge.pdf", "content_type": CONTENT_TYPE, "size": s3.UPLOAD_MAX_BYTES + 1,
+    })
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "file_too_large"
+
+
+def test_confirm_without_upload_is_bad_request(client, session_factory):
+    data = presign(client)
+
+    response = confirm(client, data["upload_id"])
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "upload_not_received"
+    assert stored_upload(session_factory, data["upload_id"]).status == "pending"
+
+
+@pytest.mark.parametrize("body, content_type", [
+    (b"x" * (DECLARED_SIZE + 1), CONTENT_TYPE),
+    (b"x" * DECLARED_SIZE, "image/png"),
+], ids=["too_large", "wrong_type"])
+def test_confirm_deletes_mismatched_object(client, bucket, session_factory, body, content_type):
+    data = presign(client, method="put")
+    bucket.put_object(Bucket=s3.AWS_BUCKET_NAME, Key=data["key"], Body=body, ContentType=content_type)
+
+    response = confirm(client, data["upload_id"])
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "upload_rejected"
+    assert not object_exists(bucket, data["key"])
+    upload = stored_upload(session_factory, data["upload_id"])
+    assert upload.status == "pending"
+    assert upload.confirmed_at is None
+
+
+def test_confirm_records_uploaded_key(client, bucket, session_factory):
+    data = presign(client)
+    bucket.put_object(Bucket=s3.AWS_BUCKET_NAME, Key=data["key"], Body=b"%PDF" * 100, ContentType=CONTENT_TYPE)
+
+    response = confirm(client, data["upload_id"])
+
+    assert response.status_code == 200, response.text
+    body = response.json()["data"]
+    assert body["key"] == data["key"]
+    assert body["status"] == "uploaded"
+    assert body["url"].endswith(data["key"])
+    upload = stored_upload(session_factory, data["upload_id"])
+    assert upload.key == data["key"]
+    assert upload.status == "uploaded"
+    assert upload.size == 400
+    assert upload.confirmed_at is not None
+    assert object_exists(bucket, data["key"])
+
+
+def proxy_upload(client, body=b"%PDF" * 100):
+    return client.post(
+        "/api/admin/v1/uploads",
+        files={"file": ("contract.pdf", body, CONTENT_TYPE)},
+        data={"folder": "contracts"},
+    )
+
+
+def test_proxy_upload_is_accepted_and_queued(client, proxy, session_factory, tmp_path):
+    response = proxy_upload(client)
+
+    assert response.status_code == 202, response.text
+    data = response.json()["data"]
+    assert data["status"] == "queued"
+    assert data["size"] == 400
+    assert stored_upload(session_factory, data["upload_id"]).status == "queued"
+    assert len(proxy.submitted) == 1
+    assert len(list(tmp_path.glob("upload-*"))) == 1
+
+
+def test_transfer_uploads_object_and_removes_spool_file(client, bucket, proxy, session_factory, tmp_path):
+    data = proxy_upload(client).json()["data"]
+
+    proxy.run_all()
+
+    upload = stored_upload(session_factory, data["upload_id"])
+    assert upload.status == "uploaded"
+    assert upload.bytes_transferred == upload.size == 400
+    assert upload.confirmed_at is not None
+    assert object_exists(bucket, data["key"])
+    assert not list(tmp_path.glob("upload-*"))
+    assert background_upload._upload_slots.acquire(blocking=False)
+
+
+def test_transfer_s3_error_marks_upload_failed(client, proxy, session_factory, tmp_path, monkeypatch):
+    data = proxy_upload(client).json()["data"]
+    monkeypatch.setattr(background_upload, "AWS_BUCKET_NAME", "missing-bucket")
+
+    proxy.run_all()
+
+    upload = stored_upload(session_factory, data["upload_id"])
+    assert upload.status == "failed"
+    assert upload.error
+    assert not list(tmp_path.glob("upload-*"))
+
+
+def test_proxy_upload_full_queue_is_503(client, proxy, session_factory):
+    while background_upload._upload_slots.acquire(blocking=False):
+        pass
+
+    response = proxy_upload(client)
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "5"
+    assert not proxy.submitted
+    with session_factory() as db:
+        assert db.query(FileUpload).count() == 0
+
+
+def test_proxy_upload_too_large_releases_slot(client, proxy, tmp_path, monkeypatch):
+    monkeypatch.setattr(background_upload, "UPLOAD_MAX_BYTES", 10)
+
+    response = proxy_upload(client, body=b"x" * 11)
+
+    assert response.status_code == 400
+    assert response.json()["message"] == "file_too_large"
+    assert not proxy.submitted
+    assert not list(tmp_path.glob("upload-*"))
+    # Both slots are free again
+    assert background_upload._upload_slots.acquire(blocking=False)
+    assert background_upload._upload_slots.acquire(blocking=False)
+
+
+def test_submit_failure_marks_upload_failed(client, proxy, session_factory, tmp_path, monkeypatch):
+    def shut_down(fn, *args):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    monkeypatch.setattr(proxy, "submit", shut_down)
+
+    response = proxy_upload(client)
+
+    assert response.status_code == 500
+    with session_factory() as db:
+        upload = db.query(FileUpload).one()
+    assert upload.status == "failed"
+    assert "shutdown" in upload.error
+    assert not list(tmp_path.glob("upload-*"))
+
+
+def test_recover_stale_uploads(proxy, session_factory, tmp_path):
+    stale_at = datetime.now(timezone.utc) - timedelta(seconds=background_upload.UPLOAD_STALE_SECONDS + 60)
+    with session_factory() as db:
+        for key, status, created_at in [
+            ("stale-queued", "queued", stale_at),
+            ("stale-uploading", "uploading", stale_at),
+            ("live", "uploading", datetime.now(timezone.utc)),
+            ("presigned", "pending", stale_at),
+        ]:
+            db.add(FileUpload(key=key, content_type=CONTENT_TYPE, max_size=1, status=status, created_at=created_at))
+        db.commit()
+    orphan = tmp_path / "upload-orphan"
+    orphan.write_bytes(b"x")
+    os.utime(orphan, (stale_at.timestamp(), stale_at.timestamp()))
+    live_file = tmp_path / "upload-live"
+    live_file.write_bytes(b"x")
+
+    assert background_upload.recover_stale_uploads() == (2, 1)
+
+    with session_factory() as db:
+        statuses = dict(db.query(FileUpload.key, FileUpload.status))
+    assert statuses == {
+        "stale-queued": "failed", "stale-uploading": "failed", "live": "uploading", "presigned": "pending",
+    }
+    assert not orphan.exists()
+    assert live_file.exists()
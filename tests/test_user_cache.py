@@ -0,0 +1,66 @@
+"""
+get_current_user's user cache: snapshot contents and commit-time invalidation.
+Runs against an in-memory SQLite users table.
+"""
+import pytest
+from fastapi import HTTPException
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+from app.core.dependencies import USER_SNAPSHOT_FIELDS, get_current_user, user_cache
+from app.core.security import create_access_token
+from app.models import User
+
+
+@pytest.fixture
+def db():
+    user_cache.clear()
+    engine = create_engine("sqlite://")
+    User.__table__.create(engine)
+    with sessionmaker(bind=engine, autoflush=False)() as session:
+        session.add(User(
+            id=1, first_name="Test", last_name="Admin", phone_number="9999988888",
+            username="admin", password="bcrypt-hash", role="ADMIN", is_active=True, is_deleted=False,
+        ))
+        session.commit()
+        yield session
+    user_cache.clear()
+    engine.dispose()
+
+
+def current_user(db) -> User:
+    return get_current_user(token=create_access_token({"sub": "1"}), db=db)
+
+
+def test_snapshot_leaves_out_the_password(db):
+    user = current_user(db)
+
+    assert set(user_cache.get("1")) == set(USER_SNAPSHOT_FIELDS)
+    assert "password" not in user_cache.get("1")
+    assert user.password is None
+    assert user.username == "admin"
+
+
+def test_cache_is_invalidated_on_commit_not_flush(db):
+    current_user(db)
+    user = db.get(User, 1)
+    user.is_deleted = True
+
+    db.flush()
+    # Other requests still see the committed row until the commit
+    assert user_cache.get("1") is not None
+
+    db.commit()
+    assert user_cache.get("1") is None
+    with pytest.raises(HTTPException):
+        current_user(db)
+
+
+def test_rollback_keeps_the_cache(db):
+    current_user(db)
+    db.get(User, 1).is_active = False
+    db.flush()
+
+    db.rollback()
+
+    assert user_cache.get("1") is not None
+    assert "written_user_ids" not in db.info